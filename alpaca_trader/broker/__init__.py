@@ -4,6 +4,6 @@ This module contains the implementation of the broker agent that interprets user
 instructions and executes trades accordingly.
 """
 
-from .ai_broker import AIBroker
+from .ai_broker import AIBroker, get_broker
 
-__all__ = ["AIBroker"] 
\ No newline at end of file
+__all__ = ["AIBroker", "get_broker"] 
\ No newline at end of file
@@ -6,9 +6,15 @@ This demonstrates how to use the AIBroker class to process user instructions.
 import os
 import json
 import re
+import traceback
 import uuid
 from dotenv import load_dotenv
-from .ai_broker import AIBroker, UUIDEncoder
+from .ai_broker import get_broker, dumps
+
+# Precompiled section pattern; one finditer pass locates both the
+# broker_response and actual_results sections (batched responses carry
+# an id attribute on the opening broker_response tag)
+_TAGS_RE = re.compile(r'<(broker_response|actual_results)(?:\s+id="\d+")?>(.*?)</\1>', re.DOTALL)
 
 def main():
     """Run a demo of the AI broker agent."""
@@ -33,8 +39,8 @@ def main():
     print("      The broker will still attempt to execute orders with the available data.")
     print()
     
-    # Initialize broker
-    broker = AIBroker()
+    # Initialize broker (shared singleton)
+    broker = get_broker()
     
     # Example instructions to process
     examples = [
@@ -52,10 +58,13 @@ def main():
     choice = input("> ")
     
     if choice == "1":
-        print("\nProcessing example instructions:")
-        for i, example in enumerate(examples):
+        # Send all examples in one batched Claude call instead of one
+        # round-trip per instruction
+        print("\nProcessing example instructions as a single batch:")
+        responses = broker.process_instructions_batch(examples)
+        for i, (example, response) in enumerate(zip(examples, responses)):
             print(f"\nExample {i+1}: {example}")
-            process_and_print_response(broker, example)
+            print_response(response)
     elif choice == "3":
         run_direct_tests(broker)
     else:
@@ -131,43 +140,50 @@ def run_direct_tests(broker):
 def print_formatted_result(result):
     """Print a result dictionary in a readable format."""
     print("\nResult:")
-    print(json.dumps(result, indent=2, cls=UUIDEncoder))
+    print(dumps(result))
 
 def process_and_print_response(broker, instruction):
     """Process an instruction and print the response."""
     print("\nProcessing instruction:", instruction)
     print("\nAI broker thinking...")
-    
+
     try:
         response = broker.process_instruction(instruction)
-        
-        # Print formatted response
-        print("\nResponse:")
-        print("=" * 80)
-        
-        # Extract and format the broker response section
-        broker_response = re.search(r'<broker_response>(.*?)</broker_response>', response, re.DOTALL)
-        if broker_response:
-            print(broker_response.group(0))
-        else:
-            print(response)
-            
-        # Extract and format the actual results section if it exists
-        actual_results = re.search(r'<actual_results>(.*?)</actual_results>', response, re.DOTALL)
-        if actual_results:
-            print("\nActual Results (Technical Details):")
-            try:
-                results_text = actual_results.group(1)
-                results_dict = json.loads(results_text)
-                print(json.dumps(results_dict, indent=2, cls=UUIDEncoder))
-            except json.JSONDecodeError:
-                print(actual_results.group(1))
-                
-        print("=" * 80)
+        print_response(response)
     except Exception as e:
         print(f"Error processing instruction: {e}")
-        import traceback
         traceback.print_exc()
 
+def print_response(response):
+    """Print a broker response string in a readable format."""
+    # Print formatted response
+    print("\nResponse:")
+    print("=" * 80)
+
+    # Locate both sections with a single scan of the response
+    sections = {}
+    for match in _TAGS_RE.finditer(response):
+        sections[match.group(1)] = match
+
+    # Print the broker response section
+    broker_response = sections.get('broker_response')
+    if broker_response:
+        print(broker_response.group(0))
+    else:
+        print(response)
+
+    # Print the actual results section if it exists
+    actual_results = sections.get('actual_results')
+    if actual_results:
+        print("\nActual Results (Technical Details):")
+        try:
+            results_text = actual_results.group(2)
+            results_dict = json.loads(results_text)
+            print(dumps(results_dict))
+        except json.JSONDecodeError:
+            print(actual_results.group(2))
+
+    print("=" * 80)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,9 +4,8 @@ This script tests the fixed functionality for buying stocks and getting market d
 """
 
 import os
-import json
 from dotenv import load_dotenv
-from .ai_broker import AIBroker, UUIDEncoder
+from .ai_broker import get_broker, dumps
 
 def test_broker_functionality():
     """Test the core functionality of the AIBroker class."""
@@ -23,20 +22,20 @@ def test_broker_functionality():
     print("Testing the updated broker implementation...")
     print()
     
-    # Initialize broker
-    broker = AIBroker()
+    # Initialize broker (shared singleton)
+    broker = get_broker()
     
     # Test 1: Get account info
     print("Test 1: Get account information")
     account_info = broker.get_account_info()
-    print(f"Account info: {json.dumps(account_info, indent=2, cls=UUIDEncoder)}")
+    print(f"Account info: {dumps(account_info)}")
     print()
     
     # Test 2: Get stock price for a popular symbol
     symbol = "AAPL"
     print(f"Test 2: Get stock price for {symbol}")
     price_info = broker.get_stock_price(symbol)
-    print(f"Price info: {json.dumps(price_info, indent=2, cls=UUIDEncoder)}")
+    print(f"Price info: {dumps(price_info)}")
     print()
     
     # Test 3: Try market data retrieval
@@ -66,12 +65,33 @@ def test_broker_functionality():
             result = broker.buy_stock(symbol, quantity)
             
             print("Result:")
-            print(json.dumps(result, indent=2, cls=UUIDEncoder))
+            print(dumps(result))
         except ValueError:
             print("Invalid quantity. Must be a number.")
     else:
         print("Skipping buy stock test.")
-    
+
+    # Test 5: Test batched instruction processing through Claude
+    print("\nTest 5: Test batched instruction processing")
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        print("Skipping batch test (ANTHROPIC_API_KEY not set).")
+    else:
+        print("Would you like to test batched Claude processing? This sends one API call. (y/n)")
+        response = input("> ")
+
+        if response.lower() == "y":
+            instructions = [
+                "What's the current price of AAPL?",
+                "Show me my account information"
+            ]
+            print(f"Submitting {len(instructions)} instructions as one batch...")
+            responses = broker.process_instructions_batch(instructions)
+            for instruction, batch_response in zip(instructions, responses):
+                print(f"\nInstruction: {instruction}")
+                print(batch_response)
+        else:
+            print("Skipping batch test.")
+
     print("\nTests completed.")
 
 if __name__ == "__main__":
@@ -4,10 +4,39 @@ Handles API key generation and validation.
 """
 
 import re
-import json
+import sys
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..utils.config import get_config_manager
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json parsing if orjson is not installed
+    orjson = None
+
+
+def _parse_json(response):
+    """Parse a response body, decoding the raw bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Precompiled credential format patterns, compiled once at import time
+_API_KEY_RE = re.compile(r'^[A-Z0-9]{12,}$')
+_API_SECRET_RE = re.compile(r'^[a-zA-Z0-9]{32,}$')
+
+# How long a fetched account snapshot stays fresh, in seconds
+_ACCOUNT_CACHE_TTL = 2.0
+
+# Circuit breaker: after this many consecutive failures, short-circuit
+# further Alpaca calls for the cooldown period instead of waiting on a
+# degraded endpoint every time
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30.0
+
 
 class AccountManager:
     """Manages Alpaca trading accounts and API keys."""
@@ -16,7 +45,34 @@ class AccountManager:
         """Initialize the account manager with configuration."""
         self.config_manager = get_config_manager()
         self.api_key, self.api_secret, self.base_url = self.config_manager.get_alpaca_credentials()
-    
+
+        # Persistent session so repeated Alpaca calls reuse the pooled
+        # TLS connection instead of paying a fresh handshake each time
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+        self._set_session_headers()
+
+        # Short-lived account snapshot cache: (fetch time, account dict)
+        self._cache = (0.0, None)
+
+        # Circuit breaker state for Alpaca calls
+        self._breaker = {"fails": 0, "open_until": 0.0}
+
+    def _set_session_headers(self):
+        """Apply the current API credentials to the session headers."""
+        self._session.headers.update({
+            'APCA-API-KEY-ID': self.api_key or '',
+            'APCA-API-SECRET-KEY': self.api_secret or ''
+        })
+
     def is_configured(self):
         """
         Check if the account is configured with API keys.
@@ -39,11 +95,11 @@ class AccountManager:
             bool: True if configuration succeeded, False otherwise
         """
         # Validate keys format (basic validation)
-        if not api_key or not re.match(r'^[A-Z0-9]{12,}$', api_key):
+        if not api_key or not _API_KEY_RE.match(api_key):
             print("Invalid API key format. Please check your API key.")
             return False
-        
-        if not api_secret or not re.match(r'^[a-zA-Z0-9]{32,}$', api_secret):
+
+        if not api_secret or not _API_SECRET_RE.match(api_secret):
             print("Invalid API secret format. Please check your API secret.")
             return False
         
@@ -55,10 +111,12 @@ class AccountManager:
         # Save credentials if they are valid
         self.config_manager.set_alpaca_credentials(api_key, api_secret, paper_trading)
         
-        # Update instance variables
+        # Update instance variables and refresh the session credentials
         self.api_key = api_key
         self.api_secret = api_secret
-        
+        self._set_session_headers()
+        self.invalidate_cache()
+
         # Set base URL based on paper_trading flag
         if paper_trading:
             self.base_url = 'https://paper-api.alpaca.markets'
@@ -84,55 +142,109 @@ class AccountManager:
         base_url = 'https://paper-api.alpaca.markets' if paper_trading else 'https://api.alpaca.markets'
         url = f"{base_url}/v2/account"
         
-        # Send a request to the Alpaca API
+        # Send a request to the Alpaca API; the candidate keys override the
+        # session headers without being stored until validation passes
         headers = {
             'APCA-API-KEY-ID': api_key,
             'APCA-API-SECRET-KEY': api_secret
         }
-        
-        try:
-            response = requests.get(url, headers=headers)
-            # Check if the request was successful
-            if response.status_code == 200:
-                # Parse account info
-                account_info = response.json()
-                print(f"Successfully connected to Alpaca account: {account_info.get('id')}")
-                return True
-            else:
-                print(f"Failed to connect to Alpaca. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
-                return False
-        except Exception as e:
-            print(f"Error testing API keys: {e}")
+
+        response = self._get(url, headers=headers)
+        if response is None:
+            return False
+
+        # Check if the request was successful
+        if response.status_code == 200:
+            # Parse account info
+            account_info = _parse_json(response)
+            print(f"Successfully connected to Alpaca account: {account_info.get('id')}")
+            return True
+        else:
+            print(f"Failed to connect to Alpaca. Status code: {response.status_code}")
+            print(f"Response: {response.text}")
             return False
     
-    def get_account_info(self):
+    def _get(self, url, **kwargs):
+        """
+        Issue a GET through the session with the circuit breaker applied.
+
+        While the breaker is open, calls fail fast instead of waiting on
+        a degraded endpoint. Server errors and connection failures count
+        toward opening it; any successful response resets it.
+
+        Args:
+            url (str): URL to request
+            **kwargs: Extra arguments passed to session.get
+
+        Returns:
+            Response object, or None if the breaker is open or the request failed
+        """
+        now = time.monotonic()
+        if now < self._breaker["open_until"]:
+            print("Alpaca temporarily unreachable (circuit breaker open). Skipping request.")
+            return None
+
+        try:
+            response = self._session.get(url, timeout=(3, 10), **kwargs)
+        except Exception as e:
+            print(f"Error contacting Alpaca: {e}")
+            self._record_failure()
+            return None
+
+        if response.status_code >= 500:
+            self._record_failure()
+        else:
+            self._breaker["fails"] = 0
+        return response
+
+    def _record_failure(self):
+        """Count a failed Alpaca call, opening the breaker at the threshold."""
+        self._breaker["fails"] += 1
+        if self._breaker["fails"] >= _BREAKER_THRESHOLD:
+            self._breaker["open_until"] = time.monotonic() + _BREAKER_COOLDOWN
+            self._breaker["fails"] = 0
+            print(f"Too many consecutive Alpaca failures; backing off for {_BREAKER_COOLDOWN:.0f}s.")
+
+    def invalidate_cache(self):
+        """Drop the cached account snapshot so the next call fetches fresh data."""
+        self._cache = (0.0, None)
+
+    def get_account_info(self, force=False):
         """
         Get information about the Alpaca account.
-        
+
+        Repeated calls within a short window return a cached snapshot
+        instead of issuing another HTTPS request; account balances do
+        not change on that timescale.
+
+        Args:
+            force (bool, optional): Bypass the cache and fetch fresh data. Defaults to False.
+
         Returns:
             dict: Account information or None if unavailable
         """
         if not self.is_configured():
             print("Account not configured. Please configure the account first.")
             return None
-        
+
+        now = time.monotonic()
+        ts, data = self._cache
+        if not force and data is not None and now - ts < _ACCOUNT_CACHE_TTL:
+            return data
+
         url = f"{self.base_url}/v2/account"
-        headers = {
-            'APCA-API-KEY-ID': self.api_key,
-            'APCA-API-SECRET-KEY': self.api_secret
-        }
-        
-        try:
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Failed to get account information. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"Error getting account information: {e}")
+
+        response = self._get(url)
+        if response is None:
+            return None
+
+        if response.status_code == 200:
+            account_info = _parse_json(response)
+            self._cache = (now, account_info)
+            return account_info
+        else:
+            print(f"Failed to get account information. Status code: {response.status_code}")
+            print(f"Response: {response.text}")
             return None
     
     def print_account_summary(self):
@@ -141,16 +253,20 @@ class AccountManager:
         if not account_info:
             return
         
-        print("\n=== Account Summary ===")
-        print(f"Account ID: {account_info.get('id')}")
-        print(f"Status: {account_info.get('status')}")
-        print(f"Currency: {account_info.get('currency')}")
-        print(f"Cash: ${float(account_info.get('cash')):,.2f}")
-        print(f"Portfolio Value: ${float(account_info.get('portfolio_value')):,.2f}")
-        print(f"Buying Power: ${float(account_info.get('buying_power')):,.2f}")
-        print(f"Daytrade Count: {account_info.get('daytrade_count')}")
-        print(f"Pattern Day Trader: {'Yes' if account_info.get('pattern_day_trader') else 'No'}")
-        print("========================\n")
+        # One buffered write for the whole summary
+        ag = account_info.get
+        sys.stdout.write(
+            "\n=== Account Summary ===\n"
+            f"Account ID: {ag('id')}\n"
+            f"Status: {ag('status')}\n"
+            f"Currency: {ag('currency')}\n"
+            f"Cash: ${float(ag('cash')):,.2f}\n"
+            f"Portfolio Value: ${float(ag('portfolio_value')):,.2f}\n"
+            f"Buying Power: ${float(ag('buying_power')):,.2f}\n"
+            f"Daytrade Count: {ag('daytrade_count')}\n"
+            f"Pattern Day Trader: {'Yes' if ag('pattern_day_trader') else 'No'}\n"
+            "========================\n\n"
+        )
 
 
 # Singleton instance for global access
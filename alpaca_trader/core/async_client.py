@@ -0,0 +1,166 @@
+"""
+Async Alpaca API client for concurrent trading functionality.
+Mirrors the synchronous AlpacaClient on top of httpx.AsyncClient so
+batches of lookups or order submissions overlap instead of paying one
+round-trip each.
+
+The underlying AsyncClient binds its pool to the event loop it first
+runs on, so instances must not outlive a loop; open one per batch with
+``async with`` inside the coroutine that uses it.
+"""
+
+import httpx
+from .account import get_account_manager
+
+
+class AsyncAlpacaClient:
+    """Async client for interacting with the Alpaca API."""
+
+    def __init__(self):
+        """Initialize the async Alpaca client with account configuration."""
+        self.account_manager = get_account_manager()
+        self.api_key = self.account_manager.api_key
+        self.api_secret = self.account_manager.api_secret
+        self.base_url = self.account_manager.base_url
+
+        # One HTTP/2 connection multiplexes all in-flight requests, so
+        # concurrent calls share the TLS session instead of opening one each
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url or '',
+            headers=self._headers(),
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            # Same budgets as the sync client: fail fast on connect,
+            # allow reads more headroom
+            timeout=httpx.Timeout(10.0, connect=2.0, read=5.0)
+        )
+
+    def _headers(self):
+        """
+        Get the headers required for Alpaca API calls.
+
+        Returns:
+            dict: Headers with API keys
+        """
+        return {
+            'APCA-API-KEY-ID': self.api_key or '',
+            'APCA-API-SECRET-KEY': self.api_secret or '',
+            'Content-Type': 'application/json'
+        }
+
+    async def aclose(self):
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def get_account(self):
+        """
+        Get account information.
+
+        Returns:
+            dict: Account information or None if request fails
+        """
+        if not self.account_manager.is_configured():
+            print("Account not configured. Please configure the account first.")
+            return None
+
+        try:
+            response = await self._client.get('/v2/account')
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"Failed to get account information. Status code: {response.status_code}")
+                print(f"Response: {response.text}")
+                return None
+        except Exception as e:
+            print(f"Error getting account information: {e}")
+            return None
+
+    async def get_position(self, symbol):
+        """
+        Get position for a specific symbol.
+
+        Args:
+            symbol (str): The symbol to get position for
+
+        Returns:
+            dict: Position information or None if request fails
+        """
+        if not self.account_manager.is_configured():
+            print("Account not configured. Please configure the account first.")
+            return None
+
+        try:
+            response = await self._client.get(f'/v2/positions/{symbol}')
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 404:
+                print(f"No position found for {symbol}")
+                return None
+            else:
+                print(f"Failed to get position for {symbol}. Status code: {response.status_code}")
+                print(f"Response: {response.text}")
+                return None
+        except Exception as e:
+            print(f"Error getting position for {symbol}: {e}")
+            return None
+
+    async def submit_order(self, order_data):
+        """
+        Submit an order to Alpaca.
+
+        Args:
+            order_data (dict): Order parameters
+
+        Returns:
+            dict: Order information or None if request fails
+        """
+        if not self.account_manager.is_configured():
+            print("Account not configured. Please configure the account first.")
+            return None
+
+        try:
+            response = await self._client.post('/v2/orders', json=order_data)
+            if response.status_code in (200, 201):
+                order_info = response.json()
+                print(f"Order submitted successfully. Order ID: {order_info.get('id')}")
+                return order_info
+            else:
+                print(f"Failed to submit order. Status code: {response.status_code}")
+                print(f"Response: {response.text}")
+                return None
+        except Exception as e:
+            print(f"Error submitting order: {e}")
+            return None
+
+    async def cancel_order(self, order_id):
+        """
+        Cancel an order by ID.
+
+        Args:
+            order_id (str): The order ID to cancel
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.account_manager.is_configured():
+            print("Account not configured. Please configure the account first.")
+            return False
+
+        try:
+            response = await self._client.delete(f'/v2/orders/{order_id}')
+            if response.status_code == 204:
+                print(f"Order {order_id} cancelled successfully.")
+                return True
+            else:
+                print(f"Failed to cancel order {order_id}. Status code: {response.status_code}")
+                print(f"Response: {response.text}")
+                return False
+        except Exception as e:
+            print(f"Error cancelling order {order_id}: {e}")
+            return False
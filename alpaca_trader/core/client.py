@@ -3,276 +3,419 @@ Alpaca API client for trading functionality.
 Handles API interactions with Alpaca.
 """
 
-import requests
+import atexit
+import httpx
 import json
+import logging
+import threading
+import time
 from ..utils.config import get_config_manager
 from .account import get_account_manager
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json encoding if orjson is not installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # Fall back to whole-body parsing if ijson is not installed
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# How long cached account/position reads stay fresh, in seconds
+_READ_CACHE_TTL = 1.0
+
+# Order-list requests above this size are parsed incrementally from the
+# response stream instead of buffering the whole body first
+_STREAM_ORDERS_THRESHOLD = 100
+
+
+class _ByteStreamReader:
+    """Minimal file-like wrapper so ijson can read an httpx byte iterator."""
+
+    def __init__(self, iterator):
+        self._iterator = iterator
+        self._buffer = b''
+
+    def read(self, size=-1):
+        if size < 0:
+            chunks = [self._buffer]
+            chunks.extend(self._iterator)
+            self._buffer = b''
+            return b''.join(chunks)
+        while len(self._buffer) < size:
+            chunk = next(self._iterator, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _encode_json(payload):
+    """Encode a request payload to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def _decode_json(response):
+    """Parse a response body, decoding the raw bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class AlpacaClient:
     """Client for interacting with the Alpaca API."""
-    
+
     def __init__(self):
         """Initialize the Alpaca client with account configuration."""
         self.account_manager = get_account_manager()
         self.api_key = self.account_manager.api_key
         self.api_secret = self.account_manager.api_secret
         self.base_url = self.account_manager.base_url
-        
+
         # Define API endpoints
         if self.base_url:
             self.account_url = f"{self.base_url}/v2/account"
             self.orders_url = f"{self.base_url}/v2/orders"
             self.positions_url = f"{self.base_url}/v2/positions"
-    
+
+        # Preformatted path templates for per-id endpoints, so hot calls
+        # do a %-substitution instead of f-string assembly
+        self._position_path = '/v2/positions/%s'
+        self._order_path = '/v2/orders/%s'
+
+        # Build the credential headers once; they are applied to the
+        # client below, so no per-call dict allocation remains
+        self._headers_cached = {
+            'APCA-API-KEY-ID': self.api_key or '',
+            'APCA-API-SECRET-KEY': self.api_secret or '',
+            'Content-Type': 'application/json'
+        }
+
+        # Persistent HTTP/2 client: all calls target one origin, so
+        # concurrent requests multiplex over a single pooled TLS
+        # connection instead of queueing on HTTP/1.1 keep-alive
+        self._session = httpx.Client(
+            base_url=self.base_url or '',
+            headers=self._headers(),
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            transport=httpx.HTTPTransport(retries=3),
+            # Tight connect budget so a dead endpoint fails fast; reads
+            # get longer since order submission can be slow under load
+            timeout=httpx.Timeout(10.0, connect=2.0, read=5.0)
+        )
+
+        # Short-lived read cache for the polled endpoints, invalidated on
+        # any order write: key -> (fetch time, parsed body)
+        self._read_cache = {}
+
+        # Warm the connection with a cheap call so the TCP + TLS
+        # handshake happens at init instead of on the first trading call
+        if self.base_url:
+            try:
+                self._session.head('/v2/clock', timeout=2.0)
+            except Exception:
+                pass
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
     def _headers(self):
         """
         Get the headers required for Alpaca API calls.
-        
+
         Returns:
-            dict: Headers with API keys
+            dict: Headers with API keys, built once at init time
         """
-        return {
-            'APCA-API-KEY-ID': self.api_key,
-            'APCA-API-SECRET-KEY': self.api_secret,
-            'Content-Type': 'application/json'
-        }
-    
+        return self._headers_cached
+
+    def _cached_read(self, key):
+        """Return the cached body for key if it is still fresh, else None."""
+        entry = self._read_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _READ_CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _require_config(self):
+        """Check that credentials are configured, logging a hint if not."""
+        if self.account_manager.is_configured():
+            return True
+        logger.warning("Account not configured. Please configure the account first.")
+        return False
+
+    def _handle(self, response, ok=(200,), context="request"):
+        """
+        Dispatch on a response status and parse the body on success.
+
+        Replaces the per-method status ladders and print calls; failures
+        are logged instead of written to stdout so error storms (e.g.
+        rate limits) don't serialize on console I/O.
+
+        Args:
+            response: Response from the HTTP client
+            ok (tuple, optional): Status codes treated as success. Defaults to (200,).
+            context (str, optional): Label used in failure logs. Defaults to "request".
+
+        Returns:
+            Parsed JSON body ({} for bodyless 204 responses), or None on failure
+        """
+        if response.status_code in ok:
+            if response.status_code == 204:
+                return {}
+            return _decode_json(response)
+        logger.warning("Failed to %s. Status code: %s. Response: %s",
+                       context, response.status_code, response.text)
+        return None
+
     def get_account(self):
         """
         Get account information.
-        
+
         Returns:
             dict: Account information or None if request fails
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return None
-        
+
+        cached = self._cached_read('account')
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(self.account_url, headers=self._headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Failed to get account information. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
+            response = self._session.get('/v2/account')
+            account = self._handle(response, context="get account information")
+            if account is not None:
+                self._read_cache['account'] = (time.monotonic(), account)
+            return account
         except Exception as e:
-            print(f"Error getting account information: {e}")
+            logger.error("Error getting account information: %s", e)
             return None
-    
+
     def get_positions(self):
         """
         Get current positions.
-        
+
         Returns:
             list: List of positions or None if request fails
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return None
-        
+
+        cached = self._cached_read('positions')
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(self.positions_url, headers=self._headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Failed to get positions. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
+            response = self._session.get('/v2/positions')
+            positions = self._handle(response, context="get positions")
+            if positions is not None:
+                self._read_cache['positions'] = (time.monotonic(), positions)
+            return positions
         except Exception as e:
-            print(f"Error getting positions: {e}")
+            logger.error("Error getting positions: %s", e)
             return None
-    
+
     def get_position(self, symbol):
         """
         Get position for a specific symbol.
-        
+
         Args:
             symbol (str): The symbol to get position for
-            
+
         Returns:
             dict: Position information or None if request fails
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return None
-        
-        url = f"{self.positions_url}/{symbol}"
-        
+
         try:
-            response = requests.get(url, headers=self._headers())
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                print(f"No position found for {symbol}")
-                return None
-            else:
-                print(f"Failed to get position for {symbol}. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
+            response = self._session.get(self._position_path % symbol)
+            if response.status_code == 404:
+                logger.debug("No position found for %s", symbol)
                 return None
+            return self._handle(response, context=f"get position for {symbol}")
         except Exception as e:
-            print(f"Error getting position for {symbol}: {e}")
+            logger.error("Error getting position for %s: %s", symbol, e)
             return None
-    
+
     def get_orders(self, status=None, limit=50):
         """
         Get orders with optional filtering.
-        
+
         Args:
             status (str, optional): Filter by order status. Defaults to None.
             limit (int, optional): Maximum number of orders to return. Defaults to 50.
-            
+
         Returns:
             list: List of orders or None if request fails
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return None
-        
+
         params = {'limit': limit}
         if status:
             params['status'] = status
-        
+
+        # Large history pulls are parsed off the wire instead of being
+        # buffered whole; callers get a generator they can consume lazily
+        if ijson is not None and limit > _STREAM_ORDERS_THRESHOLD:
+            return self._iter_orders(params)
+
         try:
-            response = requests.get(self.orders_url, headers=self._headers(), params=params)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Failed to get orders. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
+            response = self._session.get('/v2/orders', params=params)
+            return self._handle(response, context="get orders")
         except Exception as e:
-            print(f"Error getting orders: {e}")
+            logger.error("Error getting orders: %s", e)
             return None
-    
+
+    def _iter_orders(self, params):
+        """
+        Yield orders from a streamed response one at a time.
+
+        Decoding incrementally keeps peak memory at one order instead of
+        the full response body plus its parsed structure.
+
+        Args:
+            params (dict): Query parameters for the orders endpoint
+
+        Yields:
+            dict: One order at a time
+        """
+        try:
+            with self._session.stream('GET', '/v2/orders', params=params) as response:
+                if response.status_code != 200:
+                    response.read()
+                    logger.warning("Failed to get orders. Status code: %s. Response: %s",
+                                   response.status_code, response.text)
+                    return
+                yield from ijson.items(_ByteStreamReader(response.iter_bytes()), 'item')
+        except Exception as e:
+            logger.error("Error getting orders: %s", e)
+
     def get_order(self, order_id):
         """
         Get a specific order by ID.
-        
+
         Args:
             order_id (str): The order ID
-            
+
         Returns:
             dict: Order information or None if request fails
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return None
-        
-        url = f"{self.orders_url}/{order_id}"
-        
+
         try:
-            response = requests.get(url, headers=self._headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Failed to get order {order_id}. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
+            response = self._session.get(self._order_path % order_id)
+            return self._handle(response, context=f"get order {order_id}")
         except Exception as e:
-            print(f"Error getting order {order_id}: {e}")
+            logger.error("Error getting order %s: %s", order_id, e)
             return None
-    
+
     def submit_order(self, order_data):
         """
         Submit an order to Alpaca.
-        
+
         Args:
             order_data (dict): Order parameters
-            
+
         Returns:
             dict: Order information or None if request fails
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return None
-        
+
         try:
-            response = requests.post(
-                self.orders_url,
-                headers=self._headers(),
-                data=json.dumps(order_data)
+            # Content-Type is already set on the session headers
+            response = self._session.post(
+                '/v2/orders',
+                content=_encode_json(order_data)
             )
-            
-            if response.status_code == 200 or response.status_code == 201:
-                order_info = response.json()
-                print(f"Order submitted successfully. Order ID: {order_info.get('id')}")
-                return order_info
-            else:
-                print(f"Failed to submit order. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
+            order_info = self._handle(response, ok=(200, 201), context="submit order")
+            if order_info is not None:
+                # Account balances and positions are stale after a fill
+                self._read_cache.clear()
+                logger.debug("Order submitted successfully. Order ID: %s", order_info.get('id'))
+            return order_info
         except Exception as e:
-            print(f"Error submitting order: {e}")
+            logger.error("Error submitting order: %s", e)
             return None
-    
+
     def cancel_order(self, order_id):
         """
         Cancel an order by ID.
-        
+
         Args:
             order_id (str): The order ID to cancel
-            
+
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return False
-        
-        url = f"{self.orders_url}/{order_id}"
-        
+
         try:
-            response = requests.delete(url, headers=self._headers())
-            if response.status_code == 204:
-                print(f"Order {order_id} cancelled successfully.")
-                return True
-            else:
-                print(f"Failed to cancel order {order_id}. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
+            response = self._session.delete(self._order_path % order_id)
+            if self._handle(response, ok=(204,), context=f"cancel order {order_id}") is None:
                 return False
+            self._read_cache.clear()
+            return True
         except Exception as e:
-            print(f"Error cancelling order {order_id}: {e}")
+            logger.error("Error cancelling order %s: %s", order_id, e)
             return False
-    
+
     def cancel_all_orders(self):
         """
         Cancel all open orders.
-        
+
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.account_manager.is_configured():
-            print("Account not configured. Please configure the account first.")
+        if not self._require_config():
             return False
-        
+
         try:
-            response = requests.delete(self.orders_url, headers=self._headers())
-            if response.status_code == 207:
-                result = response.json()
-                print(f"Cancelled {len(result)} orders.")
-                return True
-            else:
-                print(f"Failed to cancel all orders. Status code: {response.status_code}")
-                print(f"Response: {response.text}")
+            response = self._session.delete('/v2/orders')
+            result = self._handle(response, ok=(207,), context="cancel all orders")
+            if result is None:
                 return False
+            self._read_cache.clear()
+            logger.debug("Cancelled %d orders.", len(result))
+            return True
         except Exception as e:
-            print(f"Error cancelling all orders: {e}")
+            logger.error("Error cancelling all orders: %s", e)
             return False
 
 
-# Singleton instance for global access
 _alpaca_client = None
+_alpaca_client_lock = threading.Lock()
 
 def get_alpaca_client():
     """
     Get or create the global AlpacaClient instance.
-    
+
+    Double-checked locking: the warm path is a plain global read, and
+    the lock is held across construction so concurrent first callers
+    cannot build duplicate clients and pools.
+
     Returns:
         AlpacaClient: The global Alpaca client
     """
     global _alpaca_client
     if _alpaca_client is None:
-        _alpaca_client = AlpacaClient()
-    return _alpaca_client 
\ No newline at end of file
+        with _alpaca_client_lock:
+            if _alpaca_client is None:
+                client = AlpacaClient()
+                # Release the pooled connections cleanly on interpreter exit
+                atexit.register(client.close)
+                _alpaca_client = client
+    return _alpaca_client
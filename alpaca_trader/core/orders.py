@@ -3,26 +3,32 @@ Order functionality for Alpaca trading.
 Implements different order types (market, limit, stop, stop limit).
 """
 
+import asyncio
+import functools
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from .client import get_alpaca_client
+from .async_client import AsyncAlpacaClient
 
 
-class OrderSide(Enum):
-    """Enum for order side (buy or sell)."""
+class OrderSide(str, Enum):
+    """Enum for order side (buy or sell). Members are str, so they serialize directly."""
     BUY = "buy"
     SELL = "sell"
 
 
-class OrderType(Enum):
-    """Enum for order type."""
+class OrderType(str, Enum):
+    """Enum for order type. Members are str, so they serialize directly."""
     MARKET = "market"
     LIMIT = "limit"
     STOP = "stop"
     STOP_LIMIT = "stop_limit"
 
 
-class TimeInForce(Enum):
-    """Enum for time in force."""
+class TimeInForce(str, Enum):
+    """Enum for time in force. Members are str, so they serialize directly."""
     DAY = "day"
     GTC = "gtc"  # Good Till Cancelled
     OPG = "opg"  # Market On Open
@@ -31,6 +37,55 @@ class TimeInForce(Enum):
     FOK = "fok"  # Fill Or Kill
 
 
+# Ticker symbols: letters/digits plus the dot and dash used by share
+# classes (e.g. BRK.B)
+_SYMBOL_FORMAT_RE = re.compile(r'^[A-Z0-9.\-]{1,10}$')
+
+
+@functools.lru_cache(maxsize=1024)
+def _canon_symbol(symbol):
+    """
+    Return the validated upper-case form of a symbol, or None if malformed.
+
+    Strategies reuse the same few tickers, so the cache turns repeat
+    upper-casing and validation into a single hash lookup.
+
+    Args:
+        symbol (str): The symbol as provided by the caller
+
+    Returns:
+        str: The canonical upper-case symbol, or None if invalid
+    """
+    canonical = symbol.upper()
+    if _SYMBOL_FORMAT_RE.match(canonical):
+        return canonical
+    return None
+
+
+# Cap on in-flight bulk submissions so a large batch stays well under
+# Alpaca's 200 requests/minute limit
+_BULK_CONCURRENCY = 10
+
+# Order type strings resolved once at import time so order building
+# avoids per-order attribute access
+_MARKET_STR = OrderType.MARKET.value
+_LIMIT_STR = OrderType.LIMIT.value
+_STOP_STR = OrderType.STOP.value
+_STOP_LIMIT_STR = OrderType.STOP_LIMIT.value
+
+
+def _positive(value):
+    """Check that a numeric parameter is present and positive, converting only when needed."""
+    if value is None:
+        return False
+    if isinstance(value, (int, float)):
+        return value > 0
+    try:
+        return float(value) > 0
+    except (TypeError, ValueError):
+        return False
+
+
 class OrderManager:
     """Manages order creation and submission to Alpaca."""
     
@@ -53,22 +108,23 @@ class OrderManager:
         if not symbol:
             print("Symbol is required.")
             return False
-        
-        # Either qty or notional must be provided, but not both
-        if (qty is None and notional is None) or (qty is not None and notional is not None):
+
+        # Exactly one of qty/notional must be provided
+        has_qty = qty is not None
+        has_notional = notional is not None
+        if has_qty == has_notional:
             print("Either 'qty' or 'notional' must be provided, but not both.")
             return False
-        
-        # Check qty is valid if provided
-        if qty is not None and float(qty) <= 0:
+
+        # Check the provided amount is valid
+        if has_qty and not _positive(qty):
             print("Quantity must be positive.")
             return False
-        
-        # Check notional is valid if provided
-        if notional is not None and float(notional) <= 0:
+
+        if has_notional and not _positive(notional):
             print("Notional value must be positive.")
             return False
-        
+
         return True
     
     def _prepare_order_base(self, symbol, side, qty=None, notional=None, time_in_force=TimeInForce.DAY):
@@ -88,12 +144,20 @@ class OrderManager:
         # Validate parameters
         if not self.validate_order_parameters(symbol, qty, notional):
             return None
-        
-        # Create base order
+
+        # Canonical symbol comes from a small cache, so repeat tickers
+        # skip both upper-casing and format validation
+        symbol = _canon_symbol(symbol)
+        if symbol is None:
+            print("Invalid symbol format.")
+            return None
+
+        # Create base order; the str-backed enums go into the payload
+        # as-is, with no .value dispatch on the hot path
         order = {
-            'symbol': symbol.upper(),
-            'side': side.value,
-            'time_in_force': time_in_force.value
+            'symbol': symbol,
+            'side': side,
+            'time_in_force': time_in_force
         }
         
         # Add either qty or notional
@@ -125,7 +189,7 @@ class OrderManager:
             return None
         
         # Add market order specific parameters
-        order['type'] = OrderType.MARKET.value
+        order['type'] = _MARKET_STR
         if extended_hours:
             order['extended_hours'] = True
         
@@ -154,12 +218,12 @@ class OrderManager:
             return None
         
         # Validate limit price
-        if not limit_price or float(limit_price) <= 0:
+        if not _positive(limit_price):
             print("Limit price must be positive.")
             return None
-        
+
         # Add limit order specific parameters
-        order['type'] = OrderType.LIMIT.value
+        order['type'] = _LIMIT_STR
         order['limit_price'] = str(limit_price)
         if extended_hours:
             order['extended_hours'] = True
@@ -188,12 +252,12 @@ class OrderManager:
             return None
         
         # Validate stop price
-        if not stop_price or float(stop_price) <= 0:
+        if not _positive(stop_price):
             print("Stop price must be positive.")
             return None
-        
+
         # Add stop order specific parameters
-        order['type'] = OrderType.STOP.value
+        order['type'] = _STOP_STR
         order['stop_price'] = str(stop_price)
         
         # Submit the order
@@ -221,34 +285,143 @@ class OrderManager:
             return None
         
         # Validate prices
-        if not stop_price or float(stop_price) <= 0:
+        if not _positive(stop_price):
             print("Stop price must be positive.")
             return None
-        
-        if not limit_price or float(limit_price) <= 0:
+
+        if not _positive(limit_price):
             print("Limit price must be positive.")
             return None
-        
+
         # Add stop limit order specific parameters
-        order['type'] = OrderType.STOP_LIMIT.value
+        order['type'] = _STOP_LIMIT_STR
         order['stop_price'] = str(stop_price)
         order['limit_price'] = str(limit_price)
         
         # Submit the order
         return self.client.submit_order(order)
     
+    def make_market_submitter(self, side, time_in_force=TimeInForce.DAY):
+        """
+        Build a submitter specialized for one market-order shape.
+
+        The side/TIF/type fields are baked into a template up front, so
+        a strategy's inner loop only fills in symbol and qty and skips
+        the general validation path entirely. Intended for tight loops
+        where orders differ only by symbol and quantity.
+
+        Args:
+            side (OrderSide): Buy or sell, fixed for all orders
+            time_in_force (TimeInForce, optional): Time in force. Defaults to TimeInForce.DAY.
+
+        Returns:
+            callable: submit(symbol, qty) -> order info dict or None
+        """
+        template = {
+            'side': side,
+            'time_in_force': time_in_force,
+            'type': _MARKET_STR
+        }
+        submit_order = self.client.submit_order
+
+        def submit(symbol, qty):
+            symbol = _canon_symbol(symbol)
+            if symbol is None:
+                print("Invalid symbol format.")
+                return None
+            order = template.copy()
+            order['symbol'] = symbol
+            order['qty'] = str(qty)
+            return submit_order(order)
+
+        return submit
+
+    async def market_orders_bulk(self, orders):
+        """
+        Submit several market orders concurrently.
+
+        Each entry is prepared like a single market order, then all
+        submissions run at once over the async client so a batch costs
+        roughly one round-trip instead of one per order.
+
+        Args:
+            orders (list): List of dicts with the market_order arguments
+                (symbol, side, and optionally qty, notional, time_in_force,
+                extended_hours)
+
+        Returns:
+            list: Order information dicts (None entries for failed orders)
+        """
+        prepared = []
+        for params in orders:
+            order = self._prepare_order_base(
+                params.get('symbol'),
+                params.get('side'),
+                params.get('qty'),
+                params.get('notional'),
+                params.get('time_in_force', TimeInForce.DAY)
+            )
+            if not order:
+                prepared.append(None)
+                continue
+
+            order['type'] = _MARKET_STR
+            if params.get('extended_hours'):
+                order['extended_hours'] = True
+            prepared.append(order)
+
+        # Submit all valid orders concurrently (bounded by the
+        # semaphore); invalid entries stay None. The client is opened
+        # per batch: callers drive each batch with asyncio.run, and a
+        # pool kept across calls would stay bound to the first, now
+        # closed, event loop
+        semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+        async def _submit(client, order):
+            async with semaphore:
+                return await client.submit_order(order)
+
+        async with AsyncAlpacaClient() as client:
+            results = await asyncio.gather(*[
+                _submit(client, order)
+                for order in prepared if order is not None
+            ])
+
+        # Merge the submission results back into input order
+        results_iter = iter(results)
+        return [None if order is None else next(results_iter) for order in prepared]
+
     def cancel_order(self, order_id):
         """
         Cancel an order by ID.
-        
+
         Args:
             order_id (str): The order ID to cancel
-            
+
         Returns:
             bool: True if successful, False otherwise
         """
         return self.client.cancel_order(order_id)
     
+    def cancel_orders_bulk(self, order_ids):
+        """
+        Cancel several orders concurrently.
+
+        Cancellations are independent DELETE calls, so they run on a
+        thread pool instead of serially waiting one round-trip each.
+
+        Args:
+            order_ids (list): Order IDs to cancel
+
+        Returns:
+            list: Per-order booleans, in the same order as order_ids
+        """
+        if not order_ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            return list(executor.map(self.client.cancel_order, order_ids))
+
     def cancel_all_orders(self):
         """
         Cancel all open orders.
@@ -284,17 +457,23 @@ class OrderManager:
         return self.client.get_order(order_id)
 
 
-# Singleton instance for global access
 _order_manager = None
+_order_manager_lock = threading.Lock()
 
 def get_order_manager():
     """
     Get or create the global OrderManager instance.
-    
+
+    Double-checked locking: the warm path is a plain global read, and
+    the lock is held across construction so concurrent first callers
+    always receive the same manager.
+
     Returns:
         OrderManager: The global order manager
     """
     global _order_manager
     if _order_manager is None:
-        _order_manager = OrderManager()
+        with _order_manager_lock:
+            if _order_manager is None:
+                _order_manager = OrderManager()
     return _order_manager 
\ No newline at end of file
@@ -3,6 +3,10 @@ Main entry point for the Alpaca trader application.
 Demonstrates account setup and order execution.
 """
 
+import asyncio
+import atexit
+import os
+import re
 import sys
 import time
 from getpass import getpass
@@ -52,20 +56,104 @@ def setup_account():
         return False
 
 
+# Menu text frozen once at import time; the loop prints it with a
+# single write instead of a dozen print calls per iteration
+_MENU_TEXT = (
+    "\n=== Alpaca Trader Menu ===\n"
+    "1. View Account\n"
+    "2. Place Market Order\n"
+    "3. Place Limit Order\n"
+    "4. Place Stop Order\n"
+    "5. Place Stop Limit Order\n"
+    "6. View Orders\n"
+    "7. Cancel Order\n"
+    "8. Cancel All Orders\n"
+    "9. View Positions\n"
+    "B. Batch Market Orders\n"
+    "R. Refresh Dashboard (account + positions + open orders)\n"
+    "0. Exit\n"
+    "========================\n"
+)
+
+
 def display_menu():
     """Display the main menu options."""
-    print("\n=== Alpaca Trader Menu ===")
-    print("1. View Account")
-    print("2. Place Market Order")
-    print("3. Place Limit Order")
-    print("4. Place Stop Order")
-    print("5. Place Stop Limit Order")
-    print("6. View Orders")
-    print("7. Cancel Order")
-    print("8. Cancel All Orders")
-    print("9. View Positions")
-    print("0. Exit")
-    print("========================")
+    sys.stdout.write(_MENU_TEXT)
+
+
+# Accepts plain decimal numbers; compiled once so retry loops reuse it
+_PRICE_RE = re.compile(r'^\d+(\.\d+)?$')
+
+# Field order for the order report; extracted in one C-level pass per
+# order via map(order.get, ...) — itemgetter would raise on the
+# optional keys, which are absent for unfilled or market orders
+_ORDER_FIELDS = (
+    'id', 'symbol', 'side', 'type', 'qty', 'notional', 'limit_price',
+    'stop_price', 'time_in_force', 'status', 'filled_qty',
+    'filled_avg_price', 'submitted_at', 'updated_at'
+)
+
+
+def _prompt_positive_decimal(prompt):
+    """
+    Prompt until the user enters a positive numeric value.
+
+    Decimal keeps money amounts exact instead of rounding through
+    float, and the precompiled pattern rejects bad input before any
+    conversion is attempted.
+
+    Args:
+        prompt (str): Prompt text shown to the user
+
+    Returns:
+        Decimal: The entered positive value
+    """
+    while True:
+        value_str = input(prompt).strip()
+        if not _PRICE_RE.match(value_str):
+            print("Invalid input. Please enter a numeric value.")
+            continue
+        value = Decimal(value_str)
+        if value > 0:
+            return value
+        print("Value must be positive.")
+
+
+def _read_symbol():
+    """
+    Prompt for a ticker symbol and return its interned upper-case form.
+
+    The same few tickers get typed over and over across menu
+    iterations; interning makes repeats share one string object, so
+    downstream dict lookups keyed by symbol compare by identity.
+
+    Returns:
+        str: The interned upper-case symbol
+    """
+    symbol = input("Symbol (e.g., AAPL): ").strip()
+    if not symbol.isupper():
+        symbol = symbol.upper()
+    return sys.intern(symbol)
+
+
+# Prompt dispatch tables and text built once at import time; each
+# answer resolves with a single dict lookup
+_SIDE_MAP = {'buy': OrderSide.BUY, 'sell': OrderSide.SELL}
+
+_TIF_PROMPT = (
+    "\nTime in Force Options:\n"
+    "1. Day (valid for the day only)\n"
+    "2. GTC (good till cancelled)\n"
+    "3. IOC (immediate or cancel)\n"
+    "4. FOK (fill or kill)\n"
+)
+_TIF_MAP = {
+    '': TimeInForce.DAY,
+    '1': TimeInForce.DAY,
+    '2': TimeInForce.GTC,
+    '3': TimeInForce.IOC,
+    '4': TimeInForce.FOK,
+}
 
 
 def get_order_side():
@@ -76,13 +164,10 @@ def get_order_side():
         OrderSide: The selected order side
     """
     while True:
-        response = input("Order side (buy/sell): ").strip().lower()
-        if response == 'buy':
-            return OrderSide.BUY
-        elif response == 'sell':
-            return OrderSide.SELL
-        else:
-            print("Invalid choice. Please enter 'buy' or 'sell'.")
+        side = _SIDE_MAP.get(input("Order side (buy/sell): ").strip().lower())
+        if side is not None:
+            return side
+        print("Invalid choice. Please enter 'buy' or 'sell'.")
 
 
 def get_time_in_force():
@@ -92,24 +177,13 @@ def get_time_in_force():
     Returns:
         TimeInForce: The selected time in force
     """
-    print("\nTime in Force Options:")
-    print("1. Day (valid for the day only)")
-    print("2. GTC (good till cancelled)")
-    print("3. IOC (immediate or cancel)")
-    print("4. FOK (fill or kill)")
-    
+    sys.stdout.write(_TIF_PROMPT)
+
     while True:
-        response = input("Choose time in force (1-4, default 1): ").strip()
-        if not response or response == '1':
-            return TimeInForce.DAY
-        elif response == '2':
-            return TimeInForce.GTC
-        elif response == '3':
-            return TimeInForce.IOC
-        elif response == '4':
-            return TimeInForce.FOK
-        else:
-            print("Invalid choice. Please enter a number from 1-4.")
+        tif = _TIF_MAP.get(input("Choose time in force (1-4, default 1): ").strip())
+        if tif is not None:
+            return tif
+        print("Invalid choice. Please enter a number from 1-4.")
 
 
 def get_quantity_or_notional():
@@ -120,29 +194,10 @@ def get_quantity_or_notional():
         tuple: (qty, notional) one of which will be None
     """
     response = input("Use quantity in shares (q) or notional value in dollars (n)? (q/n): ").strip().lower()
-    
+
     if response == 'q':
-        while True:
-            qty_str = input("Quantity (shares): ").strip()
-            try:
-                qty = float(qty_str)
-                if qty <= 0:
-                    print("Quantity must be positive.")
-                    continue
-                return qty, None
-            except ValueError:
-                print("Invalid input. Please enter a numeric value.")
-    else:
-        while True:
-            notional_str = input("Notional value (dollars): $").strip()
-            try:
-                notional = float(notional_str)
-                if notional <= 0:
-                    print("Notional value must be positive.")
-                    continue
-                return None, notional
-            except ValueError:
-                print("Invalid input. Please enter a numeric value.")
+        return _prompt_positive_decimal("Quantity (shares): "), None
+    return None, _prompt_positive_decimal("Notional value (dollars): $")
 
 
 def place_market_order():
@@ -152,7 +207,7 @@ def place_market_order():
     print("\n=== Place Market Order ===")
     
     # Get symbol
-    symbol = input("Symbol (e.g., AAPL): ").strip().upper()
+    symbol = _read_symbol()
     
     # Get order side
     side = get_order_side()
@@ -167,17 +222,17 @@ def place_market_order():
     extended_hours_str = input("Allow extended hours trading? (y/n, default: n): ").strip().lower()
     extended_hours = extended_hours_str == 'y'
     
-    # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side.value}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Market")
-    print(f"Time in Force: {time_in_force.value}")
-    print(f"Extended Hours: {'Yes' if extended_hours else 'No'}")
+    # Confirm order with one buffered write
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side.value}\n"
+        f"{amount}\n"
+        "Type: Market\n"
+        f"Time in Force: {time_in_force.value}\n"
+        f"Extended Hours: {'Yes' if extended_hours else 'No'}\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -202,22 +257,13 @@ def place_limit_order():
     print("\n=== Place Limit Order ===")
     
     # Get symbol
-    symbol = input("Symbol (e.g., AAPL): ").strip().upper()
+    symbol = _read_symbol()
     
     # Get order side
     side = get_order_side()
     
     # Get limit price
-    while True:
-        limit_price_str = input("Limit Price: $").strip()
-        try:
-            limit_price = float(limit_price_str)
-            if limit_price <= 0:
-                print("Limit price must be positive.")
-                continue
-            break
-        except ValueError:
-            print("Invalid input. Please enter a numeric value.")
+    limit_price = _prompt_positive_decimal("Limit Price: $")
     
     # Get quantity or notional
     qty, notional = get_quantity_or_notional()
@@ -229,18 +275,18 @@ def place_limit_order():
     extended_hours_str = input("Allow extended hours trading? (y/n, default: n): ").strip().lower()
     extended_hours = extended_hours_str == 'y'
     
-    # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side.value}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Limit")
-    print(f"Limit Price: ${limit_price}")
-    print(f"Time in Force: {time_in_force.value}")
-    print(f"Extended Hours: {'Yes' if extended_hours else 'No'}")
+    # Confirm order with one buffered write
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side.value}\n"
+        f"{amount}\n"
+        "Type: Limit\n"
+        f"Limit Price: ${limit_price}\n"
+        f"Time in Force: {time_in_force.value}\n"
+        f"Extended Hours: {'Yes' if extended_hours else 'No'}\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -265,22 +311,13 @@ def place_stop_order():
     print("\n=== Place Stop Order ===")
     
     # Get symbol
-    symbol = input("Symbol (e.g., AAPL): ").strip().upper()
+    symbol = _read_symbol()
     
     # Get order side
     side = get_order_side()
     
     # Get stop price
-    while True:
-        stop_price_str = input("Stop Price: $").strip()
-        try:
-            stop_price = float(stop_price_str)
-            if stop_price <= 0:
-                print("Stop price must be positive.")
-                continue
-            break
-        except ValueError:
-            print("Invalid input. Please enter a numeric value.")
+    stop_price = _prompt_positive_decimal("Stop Price: $")
     
     # Get quantity or notional
     qty, notional = get_quantity_or_notional()
@@ -288,17 +325,17 @@ def place_stop_order():
     # Get time in force
     time_in_force = get_time_in_force()
     
-    # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side.value}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Stop")
-    print(f"Stop Price: ${stop_price}")
-    print(f"Time in Force: {time_in_force.value}")
+    # Confirm order with one buffered write
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side.value}\n"
+        f"{amount}\n"
+        "Type: Stop\n"
+        f"Stop Price: ${stop_price}\n"
+        f"Time in Force: {time_in_force.value}\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -323,34 +360,16 @@ def place_stop_limit_order():
     print("\n=== Place Stop Limit Order ===")
     
     # Get symbol
-    symbol = input("Symbol (e.g., AAPL): ").strip().upper()
+    symbol = _read_symbol()
     
     # Get order side
     side = get_order_side()
     
     # Get stop price
-    while True:
-        stop_price_str = input("Stop Price: $").strip()
-        try:
-            stop_price = float(stop_price_str)
-            if stop_price <= 0:
-                print("Stop price must be positive.")
-                continue
-            break
-        except ValueError:
-            print("Invalid input. Please enter a numeric value.")
+    stop_price = _prompt_positive_decimal("Stop Price: $")
     
     # Get limit price
-    while True:
-        limit_price_str = input("Limit Price: $").strip()
-        try:
-            limit_price = float(limit_price_str)
-            if limit_price <= 0:
-                print("Limit price must be positive.")
-                continue
-            break
-        except ValueError:
-            print("Invalid input. Please enter a numeric value.")
+    limit_price = _prompt_positive_decimal("Limit Price: $")
     
     # Get quantity or notional
     qty, notional = get_quantity_or_notional()
@@ -358,18 +377,18 @@ def place_stop_limit_order():
     # Get time in force
     time_in_force = get_time_in_force()
     
-    # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side.value}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Stop Limit")
-    print(f"Stop Price: ${stop_price}")
-    print(f"Limit Price: ${limit_price}")
-    print(f"Time in Force: {time_in_force.value}")
+    # Confirm order with one buffered write
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side.value}\n"
+        f"{amount}\n"
+        "Type: Stop Limit\n"
+        f"Stop Price: ${stop_price}\n"
+        f"Limit Price: ${limit_price}\n"
+        f"Time in Force: {time_in_force.value}\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -387,6 +406,47 @@ def place_stop_limit_order():
         print("Failed to submit stop limit order.")
 
 
+def place_batch_orders():
+    """Queue several market orders and submit them concurrently."""
+    order_manager = get_order_manager()
+
+    print("\n=== Batch Market Orders ===")
+    print("Queue up market orders; they are all submitted together at the end.")
+
+    pending = []
+    while True:
+        symbol = input("\nSymbol (blank to finish): ").strip().upper()
+        if not symbol:
+            break
+
+        side = get_order_side()
+        qty, notional = get_quantity_or_notional()
+
+        pending.append({'symbol': symbol, 'side': side, 'qty': qty, 'notional': notional})
+        print(f"Queued {len(pending)} order(s).")
+
+    if not pending:
+        print("No orders queued.")
+        return
+
+    # Confirm the whole batch once instead of per order
+    confirm = input(f"\nSubmit {len(pending)} market order(s)? (y/n): ").strip().lower()
+    if confirm != 'y':
+        print("Batch cancelled.")
+        return
+
+    # All submissions fly concurrently over the shared async client
+    results = asyncio.run(order_manager.market_orders_bulk(pending))
+
+    succeeded = sum(1 for result in results if result)
+    print(f"\nSubmitted {succeeded} of {len(pending)} order(s) successfully.")
+    for params, result in zip(pending, results):
+        if result:
+            print(f"  {params['symbol']}: Order ID {result.get('id')}")
+        else:
+            print(f"  {params['symbol']}: failed")
+
+
 def view_orders():
     """View and display orders."""
     order_manager = get_order_manager()
@@ -409,45 +469,58 @@ def view_orders():
     limit = int(limit_str) if limit_str and limit_str.isdigit() else 10
     
     orders = order_manager.get_orders(status, limit)
-    
+
+    # Large pulls come back as a generator; materialize for counting
+    if orders is not None and not isinstance(orders, list):
+        orders = list(orders)
+
     if not orders:
         print("No orders found or failed to retrieve orders.")
         return
-    
-    print(f"\nFound {len(orders)} orders:")
+
+    # Build the whole report and flush it in one write instead of a
+    # print (and syscall) per field
+    parts = [f"\nFound {len(orders)} orders:"]
     for i, order in enumerate(orders):
-        print(f"\n--- Order {i+1} ---")
-        print(f"ID: {order.get('id')}")
-        print(f"Symbol: {order.get('symbol')}")
-        print(f"Side: {order.get('side')}")
-        print(f"Type: {order.get('type')}")
-        
-        # Print quantity info
-        if 'qty' in order:
-            print(f"Quantity: {order.get('qty')} shares")
-        elif 'notional' in order:
-            print(f"Notional: ${order.get('notional')}")
-        
-        # Print price info based on order type
-        if order.get('type') == 'limit' or order.get('type') == 'stop_limit':
-            print(f"Limit Price: ${order.get('limit_price')}")
-        if order.get('type') == 'stop' or order.get('type') == 'stop_limit':
-            print(f"Stop Price: ${order.get('stop_price')}")
-        
-        print(f"Time in Force: {order.get('time_in_force')}")
-        print(f"Status: {order.get('status')}")
-        
-        # Print filled quantity and price if available
-        if order.get('filled_qty'):
-            print(f"Filled Quantity: {order.get('filled_qty')}")
-        if order.get('filled_avg_price'):
-            print(f"Filled Average Price: ${order.get('filled_avg_price')}")
-        
-        # Print submission and update times
-        if order.get('submitted_at'):
-            print(f"Submitted At: {order.get('submitted_at')}")
-        if order.get('updated_at'):
-            print(f"Updated At: {order.get('updated_at')}")
+        # All fields come out in one pass instead of a .get call per line
+        (order_id, symbol, side, order_type, qty, notional, limit_price,
+         stop_price, time_in_force, status, filled_qty, filled_avg_price,
+         submitted_at, updated_at) = map(order.get, _ORDER_FIELDS)
+
+        parts.append(f"\n--- Order {i+1} ---")
+        parts.append(f"ID: {order_id}")
+        parts.append(f"Symbol: {symbol}")
+        parts.append(f"Side: {side}")
+        parts.append(f"Type: {order_type}")
+
+        # Quantity info
+        if qty is not None:
+            parts.append(f"Quantity: {qty} shares")
+        elif notional is not None:
+            parts.append(f"Notional: ${notional}")
+
+        # Price info based on order type
+        if order_type in ('limit', 'stop_limit'):
+            parts.append(f"Limit Price: ${limit_price}")
+        if order_type in ('stop', 'stop_limit'):
+            parts.append(f"Stop Price: ${stop_price}")
+
+        parts.append(f"Time in Force: {time_in_force}")
+        parts.append(f"Status: {status}")
+
+        # Filled quantity and price if available
+        if filled_qty:
+            parts.append(f"Filled Quantity: {filled_qty}")
+        if filled_avg_price:
+            parts.append(f"Filled Average Price: ${filled_avg_price}")
+
+        # Submission and update times
+        if submitted_at:
+            parts.append(f"Submitted At: {submitted_at}")
+        if updated_at:
+            parts.append(f"Updated At: {updated_at}")
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def cancel_order():
@@ -463,9 +536,13 @@ def cancel_order():
         print("No open orders found or failed to retrieve orders.")
         return
     
-    print("\nOpen Orders:")
+    # One buffered write for the whole listing
+    parts = ["\nOpen Orders:"]
     for i, order in enumerate(orders):
-        print(f"{i+1}. ID: {order.get('id')} - {order.get('symbol')} {order.get('side')} {order.get('qty') or order.get('notional')} @ {order.get('type')}")
+        order_id, symbol, side, order_type, qty, notional = map(
+            order.get, ('id', 'symbol', 'side', 'type', 'qty', 'notional'))
+        parts.append(f"{i+1}. ID: {order_id} - {symbol} {side} {qty or notional} @ {order_type}")
+    sys.stdout.write("\n".join(parts) + "\n")
     
     # Get order to cancel
     while True:
@@ -528,24 +605,157 @@ def view_positions():
         print("No positions found or failed to retrieve positions.")
         return
     
-    print(f"\nFound {len(positions)} positions:")
+    # Build the whole report and flush it in one write
+    parts = [f"\nFound {len(positions)} positions:"]
     for i, position in enumerate(positions):
-        print(f"\n--- Position {i+1} ---")
-        print(f"Symbol: {position.get('symbol')}")
-        print(f"Quantity: {position.get('qty')}")
-        print(f"Side: {position.get('side')}")
-        print(f"Market Value: ${position.get('market_value')}")
-        print(f"Cost Basis: ${position.get('cost_basis')}")
-        print(f"Unrealized P/L: ${position.get('unrealized_pl')}")
-        print(f"Unrealized P/L %: {position.get('unrealized_plpc')}")
-        print(f"Current Price: ${position.get('current_price')}")
-        print(f"Avg Entry Price: ${position.get('avg_entry_price')}")
+        pg = position.get
+        parts.append(f"\n--- Position {i+1} ---")
+        parts.append(f"Symbol: {pg('symbol')}")
+        parts.append(f"Quantity: {pg('qty')}")
+        parts.append(f"Side: {pg('side')}")
+        parts.append(f"Market Value: ${pg('market_value')}")
+        parts.append(f"Cost Basis: ${pg('cost_basis')}")
+        parts.append(f"Unrealized P/L: ${pg('unrealized_pl')}")
+        parts.append(f"Unrealized P/L %: {pg('unrealized_plpc')}")
+        parts.append(f"Current Price: ${pg('current_price')}")
+        parts.append(f"Avg Entry Price: ${pg('avg_entry_price')}")
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+async def _fetch_dashboard():
+    """
+    Fetch account info, positions and open orders concurrently.
+
+    The three calls are independent, so running them together makes the
+    composite refresh cost one round-trip instead of three.
+
+    Returns:
+        tuple: (account_info, positions, orders) as returned by the managers
+    """
+    from .core.client import get_alpaca_client
+
+    account_manager = get_account_manager()
+    client = get_alpaca_client()
+    order_manager = get_order_manager()
+
+    return await asyncio.gather(
+        asyncio.to_thread(account_manager.get_account_info),
+        asyncio.to_thread(client.get_positions),
+        asyncio.to_thread(order_manager.get_orders, 'open')
+    )
+
+
+def refresh_dashboard():
+    """Display account summary, positions and open orders in one refresh."""
+    print("\n=== Dashboard ===")
+
+    account_info, positions, orders = asyncio.run(_fetch_dashboard())
+
+    if account_info:
+        print(f"Cash: ${float(account_info.get('cash')):,.2f}")
+        print(f"Portfolio Value: ${float(account_info.get('portfolio_value')):,.2f}")
+        print(f"Buying Power: ${float(account_info.get('buying_power')):,.2f}")
+    else:
+        print("Account information unavailable.")
+
+    if positions:
+        print(f"\nPositions ({len(positions)}):")
+        for position in positions:
+            print(f"  {position.get('symbol')}: {position.get('qty')} @ ${position.get('current_price')} (P/L ${position.get('unrealized_pl')})")
+    else:
+        print("\nNo positions.")
+
+    if orders:
+        print(f"\nOpen Orders ({len(orders)}):")
+        for order in orders:
+            print(f"  {order.get('symbol')} {order.get('side')} {order.get('qty') or order.get('notional')} @ {order.get('type')} ({order.get('status')})")
+    else:
+        print("\nNo open orders.")
+
+
+def _view_account():
+    """Show the account summary for menu option 1."""
+    get_account_manager().print_account_summary()
+
+
+# Dispatch table built once at import time; each menu choice becomes a
+# single dict lookup instead of walking an elif ladder
+_MENU_ACTIONS = {
+    '1': _view_account,
+    '2': place_market_order,
+    '3': place_limit_order,
+    '4': place_stop_order,
+    '5': place_stop_limit_order,
+    '6': view_orders,
+    '7': cancel_order,
+    '8': cancel_all_orders,
+    '9': view_positions,
+    'b': place_batch_orders,
+    'r': refresh_dashboard,
+}
+
+
+# Background refresh period; sits inside the account cache TTL so menu
+# reads are served from a snapshot fetched while the user was typing
+_REFRESH_INTERVAL = 1.5
+
+
+async def _background_refresh():
+    """
+    Keep the account and position caches warm while the menu blocks.
+
+    input() stalls the whole process while the user thinks; this task
+    runs on the event loop in the meantime so that by the time an
+    option is picked the answer is usually already cached.
+    """
+    from .core.client import get_alpaca_client
+
+    account_manager = get_account_manager()
+    client = get_alpaca_client()
+
+    while True:
+        try:
+            await asyncio.gather(
+                asyncio.to_thread(account_manager.get_account_info, True),
+                asyncio.to_thread(client.get_positions)
+            )
+        except Exception:
+            # A failed background refresh must never disturb the menu
+            pass
+        await asyncio.sleep(_REFRESH_INTERVAL)
+
+
+def _setup_readline():
+    """Enable line editing and persistent history for the prompts."""
+    try:
+        import readline
+    except ImportError:
+        # Not available on all platforms; prompts still work without it
+        return
+
+    history_path = os.path.expanduser('~/.alpaca_trader_history')
+    try:
+        readline.read_history_file(history_path)
+    except OSError:
+        pass
+    atexit.register(readline.write_history_file, history_path)
+
+
+async def _main_async():
+    """Run the menu loop off the event loop, with the refresher beside it."""
+    refresher = asyncio.create_task(_background_refresh())
+    try:
+        # The blocking prompt loop lives on a worker thread, leaving the
+        # event loop free for the background refresh
+        await asyncio.to_thread(_menu_loop)
+    finally:
+        refresher.cancel()
 
 
 def main():
     """Main function to run the application."""
-    from .core.client import get_alpaca_client
-    
+    _setup_readline()
+
     print("Welcome to Alpaca Paper Trading Application")
     
     # Setup account if not configured
@@ -553,33 +763,31 @@ def main():
         if not setup_account():
             print("Account setup failed. Exiting...")
             return
-    
-    # Main menu loop
+
+    asyncio.run(_main_async())
+
+
+def _menu_loop():
+    """Main menu loop; blocks on user input between actions."""
     while True:
         display_menu()
-        choice = input("Enter your choice (0-9): ").strip()
-        
+
+        # One write + one read per prompt instead of input()'s
+        # per-character prompt handling
+        sys.stdout.write("Enter your choice (0-9): ")
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            break
+        choice = line.strip()
+
         if choice == '0':
             print("Exiting Alpaca Trader. Goodbye!")
             break
-        elif choice == '1':
-            get_account_manager().print_account_summary()
-        elif choice == '2':
-            place_market_order()
-        elif choice == '3':
-            place_limit_order()
-        elif choice == '4':
-            place_stop_order()
-        elif choice == '5':
-            place_stop_limit_order()
-        elif choice == '6':
-            view_orders()
-        elif choice == '7':
-            cancel_order()
-        elif choice == '8':
-            cancel_all_orders()
-        elif choice == '9':
-            view_positions()
+
+        action = _MENU_ACTIONS.get(choice.lower())
+        if action is not None:
+            action()
         else:
             print("Invalid choice. Please try again.")
 
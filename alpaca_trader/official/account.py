@@ -4,19 +4,64 @@ Provides functionality to manage account information.
 """
 
 import os
-from alpaca.trading.client import TradingClient
+import threading
+import time
+import requests
+from collections import namedtuple
+from requests.adapters import HTTPAdapter
 from ..utils.config import get_config_manager
 
 
+# How long a fetched account snapshot stays fresh, in seconds
+_ACCOUNT_CACHE_TTL = 2.0
+
+# Flat account snapshot; reading the SDK's pydantic model goes through
+# its attribute machinery on every access, so the fields are copied out
+# once (money fields pre-converted to float) and served as a namedtuple
+AccountSummary = namedtuple('AccountSummary', [
+    'id', 'status', 'currency', 'cash', 'portfolio_value',
+    'buying_power', 'daytrade_count', 'pattern_day_trader'
+])
+
+# Session shared by every TradingClient instance, so reconfiguring
+# credentials (or mixing paper/live clients) reuses the same warm
+# connection pool instead of paying a TLS handshake per client
+_shared_session = None
+
+def _get_shared_session():
+    """
+    Get or create the pooled requests session shared by SDK clients.
+
+    Returns:
+        requests.Session: The shared session with keep-alive pooling
+    """
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = requests.Session()
+        _shared_session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=40
+        ))
+    return _shared_session
+
+
 class OfficialAccountManager:
     """Manages Alpaca trading accounts using the official SDK."""
-    
+
+    # Resolved on first client init; importing alpaca-py up front pulls
+    # in pydantic and friends, which is wasted whenever this path is
+    # never used in a session
+    _TradingClient = None
+
     def __init__(self):
         """Initialize the account manager with configuration."""
         self.config_manager = get_config_manager()
         self.api_key, self.api_secret, self.base_url = self.config_manager.get_alpaca_credentials()
         self.trading_client = None
-        
+
+        # Short-lived account snapshot cache: (fetch time, account dict)
+        self._account_cache = (0.0, None)
+
         # Initialize client if credentials are available
         if self.api_key and self.api_secret:
             self._initialize_client()
@@ -27,11 +72,32 @@ class OfficialAccountManager:
         paper = 'paper' in self.base_url if self.base_url else True
         
         try:
-            self.trading_client = TradingClient(
+            # Lazy import keeps the SDK's heavy dependency tree off the
+            # module import path; the class is cached after the first use
+            if OfficialAccountManager._TradingClient is None:
+                from alpaca.trading.client import TradingClient
+                OfficialAccountManager._TradingClient = TradingClient
+
+            self.trading_client = OfficialAccountManager._TradingClient(
                 api_key=self.api_key,
                 secret_key=self.api_secret,
                 paper=paper
             )
+            # The SDK builds a private session per client; swap in the
+            # shared pooled one so repeat calls reuse live connections
+            if hasattr(self.trading_client, '_session'):
+                self.trading_client._session = _get_shared_session()
+            # Warm the pool off-thread so a cold start doesn't block
+            # on the handshake round-trip before the menu appears
+            client = self.trading_client
+
+            def _warm():
+                try:
+                    client.get_clock()
+                except Exception:
+                    pass
+
+            threading.Thread(target=_warm, daemon=True).start()
             return True
         except Exception as e:
             print(f"Error initializing Alpaca client: {e}")
@@ -59,19 +125,38 @@ class OfficialAccountManager:
         Returns:
             bool: True if configuration succeeded, False otherwise
         """
+        # Determine base URL based on paper_trading flag
+        if paper_trading:
+            base_url = 'https://paper-api.alpaca.markets'
+        else:
+            base_url = 'https://api.alpaca.markets'
+
+        # Re-entering the current credentials is a no-op; keep the warm
+        # client and its pooled connections
+        if (self.trading_client is not None and api_key == self.api_key
+                and api_secret == self.api_secret and base_url == self.base_url):
+            print("Account already configured with these credentials.")
+            return True
+
         # Save credentials
         self.config_manager.set_alpaca_credentials(api_key, api_secret, paper_trading)
         
         # Update instance variables
         self.api_key = api_key
         self.api_secret = api_secret
-        
-        # Determine base URL based on paper_trading flag
-        if paper_trading:
-            self.base_url = 'https://paper-api.alpaca.markets'
-        else:
-            self.base_url = 'https://api.alpaca.markets'
-        
+        self.invalidate_account_cache()
+
+        # Same environment: swap the credentials on the existing client
+        # instead of rebuilding it and discarding the warm session
+        if (self.trading_client is not None and base_url == self.base_url
+                and hasattr(self.trading_client, '_api_key')):
+            self.trading_client._api_key = api_key
+            self.trading_client._secret_key = api_secret
+            print("Account configured successfully.")
+            return True
+
+        self.base_url = base_url
+
         # Initialize client
         if self._initialize_client():
             print("Account configured successfully.")
@@ -80,31 +165,45 @@ class OfficialAccountManager:
             print("Failed to initialize Alpaca client. Please check your credentials.")
             return False
     
+    def invalidate_account_cache(self):
+        """Drop the cached account snapshot so the next call fetches fresh data."""
+        self._account_cache = (0.0, None)
+
     def get_account_info(self):
         """
         Get information about the Alpaca account.
-        
+
+        Repeated calls within a short window return a cached snapshot
+        instead of going back over the network; account fields do not
+        change between two menu clicks seconds apart.
+
         Returns:
-            dict: Account information or None if unavailable
+            AccountSummary: Account snapshot or None if unavailable
         """
         if not self.is_configured():
             print("Account not configured. Please configure the account first.")
             return None
-        
+
+        now = time.monotonic()
+        ts, data = self._account_cache
+        if data is not None and now - ts < _ACCOUNT_CACHE_TTL:
+            return data
+
         try:
             account = self.trading_client.get_account()
-            # Convert account object to dictionary for compatibility with custom implementation
-            account_dict = {
-                'id': account.id,
-                'status': account.status,
-                'currency': account.currency,
-                'cash': account.cash,
-                'portfolio_value': account.portfolio_value,
-                'buying_power': account.buying_power,
-                'daytrade_count': account.daytrade_count,
-                'pattern_day_trader': account.pattern_day_trader
-            }
-            return account_dict
+            # One pass over the SDK model; consumers read plain fields
+            summary = AccountSummary(
+                id=account.id,
+                status=account.status,
+                currency=account.currency,
+                cash=float(account.cash),
+                portfolio_value=float(account.portfolio_value),
+                buying_power=float(account.buying_power),
+                daytrade_count=account.daytrade_count,
+                pattern_day_trader=account.pattern_day_trader
+            )
+            self._account_cache = (now, summary)
+            return summary
         except Exception as e:
             print(f"Error getting account information: {e}")
             return None
@@ -116,28 +215,34 @@ class OfficialAccountManager:
             return
         
         print("\n=== Account Summary (Official SDK) ===")
-        print(f"Account ID: {account_info.get('id')}")
-        print(f"Status: {account_info.get('status')}")
-        print(f"Currency: {account_info.get('currency')}")
-        print(f"Cash: ${float(account_info.get('cash')):,.2f}")
-        print(f"Portfolio Value: ${float(account_info.get('portfolio_value')):,.2f}")
-        print(f"Buying Power: ${float(account_info.get('buying_power')):,.2f}")
-        print(f"Daytrade Count: {account_info.get('daytrade_count')}")
-        print(f"Pattern Day Trader: {'Yes' if account_info.get('pattern_day_trader') else 'No'}")
+        print(f"Account ID: {account_info.id}")
+        print(f"Status: {account_info.status}")
+        print(f"Currency: {account_info.currency}")
+        print(f"Cash: ${account_info.cash:,.2f}")
+        print(f"Portfolio Value: ${account_info.portfolio_value:,.2f}")
+        print(f"Buying Power: ${account_info.buying_power:,.2f}")
+        print(f"Daytrade Count: {account_info.daytrade_count}")
+        print(f"Pattern Day Trader: {'Yes' if account_info.pattern_day_trader else 'No'}")
         print("========================\n")
 
 
-# Singleton instance for global access
-_official_account_manager = None
+_account_manager = None
+_account_manager_lock = threading.Lock()
 
 def get_official_account_manager():
     """
     Get or create the global OfficialAccountManager instance.
+
+    Double-checked locking serializes first construction, so
+    concurrent first callers cannot each build a manager — and with
+    it a TradingClient and connection pool.
     
     Returns:
         OfficialAccountManager: The global account manager
     """
-    global _official_account_manager
-    if _official_account_manager is None:
-        _official_account_manager = OfficialAccountManager()
-    return _official_account_manager 
\ No newline at end of file
+    global _account_manager
+    if _account_manager is None:
+        with _account_manager_lock:
+            if _account_manager is None:
+                _account_manager = OfficialAccountManager()
+    return _account_manager
@@ -2,7 +2,21 @@
 Data retrieval utilities using the official Alpaca SDK.
 """
 
+import asyncio
 import datetime
+import functools
+import os
+import sqlite3
+import time
+import pickle
+import re
+import httpx
+import numpy as np
+import pandas as pd
+import requests
+from collections import namedtuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from alpaca.data.historical import CryptoHistoricalDataClient, StockHistoricalDataClient
 from alpaca.data.requests import CryptoBarsRequest, StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
@@ -10,6 +24,173 @@ from alpaca.data.live import StockDataStream
 from .account import get_official_account_manager
 
 
+# How long a "no data" answer is remembered, in seconds; retries for a
+# missing symbol/range short-circuit instead of re-hitting the API
+_EMPTY_CACHE_TTL = 300.0
+
+# Bars for closed periods are immutable, so they are cached in memory
+# and on disk; warm starts then skip the network entirely
+_CACHE_DIR = os.path.expanduser('~/.cache/alpaca_trader')
+_MEM_CACHE_MAX = 128
+
+# Cache keys must be safe as filenames
+_KEY_SANITIZE_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+# Numeric bar fields, in display order
+_BAR_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Normalized bar row: the fallback printer formats this one shape,
+# so the dict-vs-object branch runs once per bar at ingestion instead
+# of inside every field lookup
+Bar = namedtuple('Bar', ('ts', 'o', 'h', 'l', 'c', 'v'))
+
+# Preparsed once; each bar then prints as a single format call
+_BAR_FMT = ('Time: {0} | Open: {1:.2f} | High: {2:.2f} | '
+            'Low: {3:.2f} | Close: {4:.2f} | Volume: {5:.2f}')
+
+
+def _to_bar(bar):
+    """
+    Normalize a dict or attribute-style bar into a Bar tuple.
+
+    Args:
+        bar: One bar in dict or object form
+
+    Returns:
+        Bar: The normalized bar row
+    """
+    if isinstance(bar, dict):
+        ts = bar.get('timestamp')
+        values = (bar.get('open'), bar.get('high'), bar.get('low'),
+                  bar.get('close'), bar.get('volume'))
+    else:
+        ts = getattr(bar, 'timestamp', None)
+        values = (bar.open, bar.high, bar.low, bar.close, bar.volume)
+    if isinstance(ts, datetime.datetime):
+        ts = ts.strftime('%Y-%m-%d %H:%M:%S')
+    return Bar(ts, *values)
+
+
+# Local snapshot database for bulk-fetched bars
+_DB_PATH = os.path.join(_CACHE_DIR, 'bars.db')
+
+# The bars endpoint accepts at most this many symbols per request
+_BULK_SYMBOL_CHUNK = 100
+
+
+def _merge_bar_payloads(target, extra):
+    """Merge one bar payload into another in place, returning the target."""
+    if not isinstance(target, dict) or not isinstance(extra, dict):
+        return target
+    if isinstance(target.get('bars'), dict) and isinstance(extra.get('bars'), dict):
+        target['bars'].update(extra['bars'])
+    else:
+        target.update(extra)
+    return target
+
+
+def _get_bars_db():
+    """Open (creating if needed) the local bar snapshot database."""
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(_DB_PATH)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS bars ('
+        'symbol TEXT, timeframe TEXT, ts TEXT, '
+        'open REAL, high REAL, low REAL, close REAL, volume REAL, '
+        'PRIMARY KEY(symbol, timeframe, ts))'
+    )
+    return conn
+
+
+# Session shared by the crypto and stock data clients; both talk to
+# data.alpaca.markets, so pooled keep-alive sockets spare every bar
+# request a fresh TCP + TLS handshake
+_data_session = None
+
+def _get_data_session():
+    """
+    Get or create the pooled requests session shared by data clients.
+
+    Returns:
+        requests.Session: The shared session with keep-alive pooling
+    """
+    global _data_session
+    if _data_session is None:
+        _data_session = requests.Session()
+        _data_session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        ))
+    return _data_session
+
+
+# One bar's width per timeframe, covering both the SDK objects and the
+# string forms the explorer passes through (which previously fell into
+# the daily default branch silently)
+_TF_DELTA = {
+    TimeFrame.Day: datetime.timedelta(days=1),
+    TimeFrame.Hour: datetime.timedelta(hours=1),
+    TimeFrame.Minute: datetime.timedelta(minutes=1),
+    '1Min': datetime.timedelta(minutes=1),
+    '5Min': datetime.timedelta(minutes=5),
+    '15Min': datetime.timedelta(minutes=15),
+    '30Min': datetime.timedelta(minutes=30),
+    '1Hour': datetime.timedelta(hours=1),
+    '1Day': datetime.timedelta(days=1),
+    '1Week': datetime.timedelta(weeks=1),
+    '1Month': datetime.timedelta(days=30),
+}
+_DEFAULT_TF_DELTA = datetime.timedelta(days=1)
+
+
+def _tf_delta(timeframe):
+    """
+    Look up one bar's width for a timeframe.
+
+    The SDK's composite timeframes (e.g. TimeFrame(5, Minute)) are
+    fresh instances, so identity lookup misses; their string form
+    ('5Min') is stable and falls back to the string keys.
+
+    Args:
+        timeframe: The bar timeframe (TimeFrame or string form)
+
+    Returns:
+        timedelta: The width of one bar
+    """
+    delta = _TF_DELTA.get(timeframe)
+    if delta is not None:
+        return delta
+    return _TF_DELTA.get(str(timeframe), _DEFAULT_TF_DELTA)
+
+
+def _floor_to_timeframe(ts, timeframe):
+    """
+    Floor a timestamp to the start of its timeframe bucket.
+
+    Aligning the end of a request to the last closed bar keeps "now"
+    from shifting on every call, so back-to-back requests produce
+    identical ranges and can be answered from the cache.
+
+    Args:
+        ts (datetime): The timestamp to align
+        timeframe: The bar timeframe (TimeFrame or string form)
+
+    Returns:
+        datetime: The aligned timestamp
+    """
+    delta = _tf_delta(timeframe)
+    if delta < datetime.timedelta(hours=1):
+        return ts.replace(second=0, microsecond=0)
+    if delta < datetime.timedelta(days=1):
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
 class DataManager:
     """Manages data retrieval using the official Alpaca SDK."""
     
@@ -18,38 +199,123 @@ class DataManager:
         self.account_manager = get_official_account_manager()
         self.api_key = self.account_manager.api_key
         self.api_secret = self.account_manager.api_secret
-        self.crypto_client = None
-        self.stock_client = None
-        
-        # Initialize clients if credentials are available
-        if self.api_key and self.api_secret:
-            self._initialize_clients()
-    
-    def _initialize_clients(self):
-        """Initialize the data clients with API keys."""
+
+        # In-memory layer of the bar cache: key -> bar data
+        self._bars_cache = {}
+
+        # Remembered empty results: request key -> time of the miss
+        self._empty_cache = {}
+
+        # HTTP/2 data client plus the event loop it was opened on;
+        # rebuilt whenever a new loop drives the async fetches
+        self._http2_client = None
+        self._http2_loop = None
+
+    @functools.cached_property
+    def crypto_client(self):
+        """
+        Crypto data client, constructed on first use.
+
+        A stock-only session never pays for this client's setup;
+        cached_property builds it once on first access.
+        """
         try:
-            self.crypto_client = CryptoHistoricalDataClient(
+            client = CryptoHistoricalDataClient(
                 api_key=self.api_key,
                 secret_key=self.api_secret
             )
-            
-            self.stock_client = StockHistoricalDataClient(
+            # The SDK builds a private session; swap in the shared
+            # pooled one so bar requests reuse warm connections
+            if hasattr(client, '_session'):
+                client._session = _get_data_session()
+            return client
+        except Exception as e:
+            print(f"Error initializing crypto data client: {e}")
+            return None
+
+    @functools.cached_property
+    def stock_client(self):
+        """
+        Stock data client, constructed on first use.
+
+        Mirrors crypto_client: nothing is built until a stock request
+        actually needs it.
+        """
+        try:
+            client = StockHistoricalDataClient(
                 api_key=self.api_key,
                 secret_key=self.api_secret
             )
-            return True
+            if hasattr(client, '_session'):
+                client._session = _get_data_session()
+            return client
         except Exception as e:
-            print(f"Error initializing data clients: {e}")
-            return False
+            print(f"Error initializing stock data client: {e}")
+            return None
     
+    def _cache_key(self, kind, symbol, timeframe, start, end, limit):
+        """Build a filename-safe cache key for one bar request."""
+        raw = f"{kind}_{symbol}_{timeframe}_{start.isoformat()}_{end.isoformat()}_{limit}"
+        return _KEY_SANITIZE_RE.sub('-', raw)
+
+    def _known_empty(self, key):
+        """Check whether this request recently came back with no data."""
+        ts = self._empty_cache.get(key)
+        if ts is not None and time.time() - ts < _EMPTY_CACHE_TTL:
+            return True
+        return False
+
+    def _is_empty_result(self, result):
+        """Check whether a bar payload contains no bars at all."""
+        if not result:
+            return True
+        if isinstance(result, dict):
+            data = result.get('bars', result)
+            if not data:
+                return True
+            if isinstance(data, dict):
+                return all(not bars for bars in data.values())
+        return False
+
+    def _cache_get(self, key):
+        """Return cached bars for key from memory or disk, else None."""
+        data = self._bars_cache.get(key)
+        if data is not None:
+            return data
+
+        try:
+            with open(os.path.join(_CACHE_DIR, key + '.pkl'), 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.PickleError):
+            return None
+
+        self._bars_cache[key] = data
+        return data
+
+    def _cache_put(self, key, data):
+        """Store bars for key in memory and on disk."""
+        # Crude but sufficient bound for an interactive tool
+        if len(self._bars_cache) >= _MEM_CACHE_MAX:
+            self._bars_cache.clear()
+        self._bars_cache[key] = data
+
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(os.path.join(_CACHE_DIR, key + '.pkl'), 'wb') as f:
+                pickle.dump(data, f)
+        except OSError:
+            # Disk cache is best-effort; the in-memory copy still works
+            pass
+
     def is_ready(self):
         """
         Check if the data manager is ready to use.
         
         Returns:
-            bool: True if clients are initialized, False otherwise
+            bool: True if credentials are configured, False otherwise
         """
-        return self.crypto_client is not None and self.stock_client is not None
+        # Clients build lazily, so readiness is a credentials check only
+        return bool(self.api_key and self.api_secret)
     
     def get_crypto_bars(self, symbol, timeframe=TimeFrame.Day, start=None, end=None, limit=50):
         """
@@ -68,24 +334,38 @@ class DataManager:
         if not self.is_ready():
             print("Data manager is not ready. Please configure the account first.")
             return None
-        
+
+        # Capture "now" once so the default end and the cacheability
+        # check agree; two separate clock reads would straddle a bucket
+        # boundary often enough to defeat cache-key equality
+        now = datetime.datetime.now()
+        if end is None:
+            end = now
+
+        # Align to the last closed bar so "now" doesn't perpetually
+        # shift the range; a later bucket boundary ends the partial bar
+        end = _floor_to_timeframe(end, timeframe)
+
+        # Set default start time to limit bars back if not provided
+        if start is None:
+            start = end - _tf_delta(timeframe) * limit
+
+        # With the range pinned to closed bars, any request ending in
+        # the past is immutable and cache-servable
+        cacheable = end <= now
+        cache_key = self._cache_key('crypto', symbol, timeframe, start, end, limit)
+
+        # A recent miss for this exact request means there is still no
+        # data; skip the round-trip
+        if self._known_empty(cache_key):
+            return {}
+
+        if cacheable:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            # Set default end time to now if not provided
-            if end is None:
-                end = datetime.datetime.now()
-            
-            # Set default start time to 50 bars back if not provided
-            if start is None:
-                # Calculate start time based on timeframe
-                if timeframe == TimeFrame.Day:
-                    start = end - datetime.timedelta(days=limit)
-                elif timeframe == TimeFrame.Hour:
-                    start = end - datetime.timedelta(hours=limit)
-                elif timeframe == TimeFrame.Minute:
-                    start = end - datetime.timedelta(minutes=limit)
-                else:
-                    start = end - datetime.timedelta(days=limit)
-            
             # Prepare request
             request_params = CryptoBarsRequest(
                 symbol_or_symbols=symbol,
@@ -97,8 +377,13 @@ class DataManager:
             
             # Get bars
             bars = self.crypto_client.get_crypto_bars(request_params,feed='us')
-            
-            return bars.dict() if hasattr(bars, 'dict') else bars
+
+            result = bars.dict() if hasattr(bars, 'dict') else bars
+            if self._is_empty_result(result):
+                self._empty_cache[cache_key] = time.time()
+            elif cacheable:
+                self._cache_put(cache_key, result)
+            return result
             
         except Exception as e:
             print(f"Error getting crypto bars: {e}")
@@ -121,24 +406,38 @@ class DataManager:
         if not self.is_ready():
             print("Data manager is not ready. Please configure the account first.")
             return None
-        
+
+        # Capture "now" once so the default end and the cacheability
+        # check agree; two separate clock reads would straddle a bucket
+        # boundary often enough to defeat cache-key equality
+        now = datetime.datetime.now()
+        if end is None:
+            end = now
+
+        # Align to the last closed bar so "now" doesn't perpetually
+        # shift the range; a later bucket boundary ends the partial bar
+        end = _floor_to_timeframe(end, timeframe)
+
+        # Set default start time to limit bars back if not provided
+        if start is None:
+            start = end - _tf_delta(timeframe) * limit
+
+        # With the range pinned to closed bars, any request ending in
+        # the past is immutable and cache-servable
+        cacheable = end <= now
+        cache_key = self._cache_key('stock', symbol, timeframe, start, end, limit)
+
+        # A recent miss for this exact request means there is still no
+        # data; skip the round-trip
+        if self._known_empty(cache_key):
+            return {}
+
+        if cacheable:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            # Set default end time to now if not provided
-            if end is None:
-                end = datetime.datetime.now()
-            
-            # Set default start time to 50 bars back if not provided
-            if start is None:
-                # Calculate start time based on timeframe
-                if timeframe == TimeFrame.Day:
-                    start = end - datetime.timedelta(days=limit)
-                elif timeframe == TimeFrame.Hour:
-                    start = end - datetime.timedelta(hours=limit)
-                elif timeframe == TimeFrame.Minute:
-                    start = end - datetime.timedelta(minutes=limit)
-                else:
-                    start = end - datetime.timedelta(days=limit)
-            
             # Prepare request
             request_params = StockBarsRequest(
                 symbol_or_symbols=symbol,
@@ -150,13 +449,261 @@ class DataManager:
             
             # Get bars
             bars = self.stock_client.get_stock_bars(request_params)
-            
-            return bars.dict() if hasattr(bars, 'dict') else bars
+
+            result = bars.dict() if hasattr(bars, 'dict') else bars
+            if self._is_empty_result(result):
+                self._empty_cache[cache_key] = time.time()
+            elif cacheable:
+                self._cache_put(cache_key, result)
+            return result
             
         except Exception as e:
             print(f"Error getting stock bars: {e}")
             return None
     
+    def _get_http2_client(self):
+        """
+        HTTP/2 client for the raw data endpoint, bound to the running loop.
+
+        All in-flight requests multiplex over one pooled TLS
+        connection, so an async fan-out never queues on HTTP/1.1
+        keep-alive sockets. The pool binds to the loop that first uses
+        it, and callers drive each fan-out with a fresh asyncio.run,
+        so the client is rebuilt whenever a different loop is running;
+        the old client's connections died with its loop, so it is
+        simply dropped.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http2_loop is not loop:
+            self._http2_loop = loop
+            self._http2_client = httpx.AsyncClient(
+                base_url='https://data.alpaca.markets',
+                headers={
+                    'APCA-API-KEY-ID': self.api_key or '',
+                    'APCA-API-SECRET-KEY': self.api_secret or ''
+                },
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                # Same budgets as the trading clients: fail fast on
+                # connect, give reads more headroom
+                timeout=httpx.Timeout(10.0, connect=2.0, read=5.0)
+            )
+        return self._http2_client
+
+    async def get_stock_bars_http2(self, symbol, timeframe=TimeFrame.Day, start=None, end=None, limit=50):
+        """
+        Get historical stock bars over the multiplexed HTTP/2 transport.
+
+        Awaiting several of these concurrently shares a single TLS
+        session with stream multiplexing, so N symbols cost roughly
+        one round-trip without head-of-line blocking.
+
+        Args:
+            symbol (str): The symbol to get bars for (e.g., 'AAPL')
+            timeframe (TimeFrame, optional): The timeframe. Defaults to TimeFrame.Day.
+            start (datetime, optional): Start time. Defaults to limit bars back.
+            end (datetime, optional): End time. Defaults to now.
+            limit (int, optional): Maximum number of bars. Defaults to 50.
+
+        Returns:
+            dict: Bar data in the same shape as get_stock_bars, or None
+        """
+        if not self.is_ready():
+            print("Data manager is not ready. Please configure the account first.")
+            return None
+
+        now = datetime.datetime.now()
+        if end is None:
+            end = now
+        end = _floor_to_timeframe(end, timeframe)
+        if start is None:
+            start = end - _tf_delta(timeframe) * limit
+
+        params = {
+            'timeframe': str(timeframe),
+            'start': start.isoformat() + 'Z',
+            'end': end.isoformat() + 'Z',
+            'limit': limit
+        }
+
+        try:
+            response = await self._get_http2_client().get(
+                f'/v2/stocks/{symbol}/bars', params=params
+            )
+            if response.status_code != 200:
+                print(f"Failed to get stock bars for {symbol}. "
+                      f"Status code: {response.status_code}")
+                return None
+            payload = response.json()
+            # Normalize to the symbol-keyed shape the printers expect
+            return {'bars': {symbol: payload.get('bars') or []}}
+        except Exception as e:
+            print(f"Error getting stock bars: {e}")
+            return None
+
+    def _store_bars_db(self, result, timeframe):
+        """
+        Persist fetched bars into the local snapshot database.
+
+        Args:
+            result (dict): Bar payload keyed by symbol
+            timeframe: The timeframe the bars were fetched at
+        """
+        if not isinstance(result, dict):
+            return
+        data = result.get('bars', result)
+        if not isinstance(data, dict):
+            return
+
+        rows = []
+        for sym, sym_bars in data.items():
+            for bar in sym_bars or ():
+                if isinstance(bar, dict):
+                    rows.append((
+                        sym, str(timeframe), str(bar.get('timestamp')),
+                        bar.get('open'), bar.get('high'), bar.get('low'),
+                        bar.get('close'), bar.get('volume')
+                    ))
+        if not rows:
+            return
+
+        try:
+            conn = _get_bars_db()
+            with conn:
+                conn.executemany(
+                    'INSERT OR IGNORE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    rows
+                )
+            conn.close()
+        except sqlite3.Error:
+            # The snapshot store is best-effort; the caller still has the data
+            pass
+
+    def get_bulk_bars(self, symbols, timeframe=TimeFrame.Day, start=None, end=None, limit=None):
+        """
+        Get historical bars for many stock symbols in one request.
+
+        The whole universe goes out as a single multi-symbol request
+        instead of one round-trip per symbol, and everything fetched is
+        persisted into a local SQLite snapshot for offline reuse.
+
+        Args:
+            symbols (list): The symbols to get bars for
+            timeframe (TimeFrame, optional): The timeframe. Defaults to TimeFrame.Day.
+            start (datetime, optional): Start time. Defaults to None.
+            end (datetime, optional): End time. Defaults to None.
+            limit (int, optional): Maximum number of bars. Defaults to None.
+
+        Returns:
+            dict: Bar data keyed by symbol, or None if the request fails
+        """
+        if not self.is_ready():
+            print("Data manager is not ready. Please configure the account first.")
+            return None
+
+        symbols = list(symbols)
+
+        try:
+            # One request per 100-symbol chunk — the endpoint's maximum —
+            # so any universe costs ceil(N/100) round-trips
+            merged = None
+            for i in range(0, len(symbols), _BULK_SYMBOL_CHUNK):
+                request_params = StockBarsRequest(
+                    symbol_or_symbols=symbols[i:i + _BULK_SYMBOL_CHUNK],
+                    timeframe=timeframe,
+                    start=start,
+                    end=end,
+                    limit=limit
+                )
+
+                bars = self.stock_client.get_stock_bars(request_params)
+
+                result = bars.dict() if hasattr(bars, 'dict') else bars
+                self._store_bars_db(result, timeframe)
+                merged = result if merged is None else _merge_bar_payloads(merged, result)
+            return merged
+
+        except Exception as e:
+            print(f"Error getting bulk bars: {e}")
+            return None
+
+    def to_soa(self, sym_bars):
+        """
+        Convert one symbol's bars to a column-oriented layout.
+
+        A list of per-bar dicts carries a Python object per row; the
+        struct-of-arrays form packs each field into one contiguous
+        numpy array, which is also the shape indicator math wants.
+
+        Args:
+            sym_bars (list): Bar dicts for one symbol
+
+        Returns:
+            dict: Column name -> numpy array
+        """
+        timestamps = [bar.get('timestamp') for bar in sym_bars]
+        try:
+            ts_array = np.array(timestamps, dtype='datetime64[ns]')
+        except (TypeError, ValueError):
+            # Timezone-aware datetimes don't coerce; keep them as objects
+            ts_array = np.array(timestamps, dtype=object)
+
+        # Prices print at two decimals, so float32 is ample and halves
+        # the bytes moved through the pipeline
+        columns = {'timestamp': ts_array}
+        for name in ('open', 'high', 'low', 'close'):
+            columns[name] = np.array([bar.get(name) for bar in sym_bars], dtype='f4')
+
+        # Volume stays integral where it can
+        volume = np.array([bar.get('volume') for bar in sym_bars], dtype='f8')
+        if volume.size and np.all(np.mod(volume, 1) == 0):
+            columns['volume'] = volume.astype('i8')
+        else:
+            columns['volume'] = volume.astype('f4')
+        return columns
+
+    def stream_stock_bars(self, symbol, timeframe=TimeFrame.Day, start=None, end=None, page_limit=10000):
+        """
+        Yield a stock symbol's bars page by page as DataFrames.
+
+        Exporting a long range from one buffered payload holds the
+        whole history in memory twice over; paging keeps memory
+        constant and lets the caller write each page out while the
+        next one is fetched.
+
+        Args:
+            symbol (str): The symbol to get bars for
+            timeframe (TimeFrame, optional): The timeframe. Defaults to TimeFrame.Day.
+            start (datetime, optional): Start time. Defaults to None.
+            end (datetime, optional): End time. Defaults to now.
+            page_limit (int, optional): Bars per page. Defaults to 10000.
+
+        Yields:
+            pandas.DataFrame: One page of bars in columnar form
+        """
+        delta = _tf_delta(timeframe)
+
+        while True:
+            result = self.get_stock_bars(symbol, timeframe, start, end, limit=page_limit)
+            if not isinstance(result, dict):
+                return
+
+            data = result.get('bars', result)
+            sym_bars = data.get(symbol) if isinstance(data, dict) else None
+            if not sym_bars:
+                return
+
+            yield pd.DataFrame(self.to_soa(sym_bars))
+
+            # A short page means the range is exhausted
+            if len(sym_bars) < page_limit:
+                return
+
+            last_ts = sym_bars[-1].get('timestamp')
+            if last_ts is None:
+                return
+            start = last_ts + delta
+
     def print_bars(self, bars, symbol=None):
         """
         Print bar data in a readable format.
@@ -168,7 +715,13 @@ class DataManager:
         if not bars:
             print("No bar data available.")
             return
-        
+
+        # BarSet objects carry a prebuilt DataFrame; format it in one
+        # vectorized pass instead of a Python loop per bar
+        if hasattr(bars, 'df'):
+            print(bars.df.to_string(float_format=lambda x: f"{x:.2f}"))
+            return
+
         # Handle both single symbol and multi-symbol responses
         if isinstance(bars, dict) and 'bars' in bars:
             # Multi-symbol format from newer SDK versions
@@ -176,20 +729,17 @@ class DataManager:
                 # Print all symbols
                 for sym, sym_data in bars['bars'].items():
                     print(f"\n=== {sym} Bars ===")
-                    for bar in sym_data:
-                        self._print_bar(bar)
+                    self._print_bar_table(sym_data)
             elif symbol in bars['bars']:
                 # Print specific symbol
                 print(f"\n=== {symbol} Bars ===")
-                for bar in bars['bars'][symbol]:
-                    self._print_bar(bar)
+                self._print_bar_table(bars['bars'][symbol])
             else:
                 print(f"Symbol {symbol} not found in bar data.")
         elif isinstance(bars, dict) and symbol in bars:
             # Single symbol request format from newer SDK versions
             print(f"\n=== {symbol} Bars ===")
-            for bar in bars[symbol]:
-                self._print_bar(bar)
+            self._print_bar_table(bars[symbol])
         else:
             # Handle older SDK versions or unexpected formats
             try:
@@ -197,50 +747,55 @@ class DataManager:
                 if isinstance(bars, dict):
                     for symbol, symbol_bars in bars.items():
                         print(f"\n=== {symbol} ===")
-                        for bar in symbol_bars:
-                            self._print_bar(bar)
+                        self._print_bar_table(symbol_bars)
                 elif isinstance(bars, list):
-                    for bar in bars:
-                        self._print_bar(bar)
+                    self._print_bar_table(bars)
                 else:
                     print("Unrecognized bar data format")
             except Exception as e:
                 print(f"Error printing bars: {e}")
     
+    def _print_bar_table(self, sym_bars):
+        """
+        Print one symbol's bars as a single vectorized pandas table.
+
+        Formatting N rows through to_string runs in C, replacing an
+        interpreter loop of five lookups and an f-string per bar.
+
+        Args:
+            sym_bars (list): Bar dicts (or objects) for one symbol
+        """
+        if not sym_bars:
+            print("No bars.")
+            return
+
+        try:
+            if all(isinstance(bar, dict) for bar in sym_bars):
+                # Columnar path: one contiguous array per field instead
+                # of a dict per bar
+                df = pd.DataFrame(self.to_soa(sym_bars))
+            else:
+                df = pd.DataFrame([vars(bar) for bar in sym_bars])
+            columns = [c for c in ('timestamp',) + _BAR_COLUMNS if c in df.columns]
+            if not columns:
+                raise ValueError("no recognizable bar columns")
+            print(df[columns].to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+        except Exception:
+            # Unexpected shapes fall back to the per-bar printer
+            for bar in sym_bars:
+                self._print_bar(bar)
+
     def _print_bar(self, bar):
         """
         Print a single bar in a readable format.
         
         Args:
-            bar (dict): Bar data
+            bar: Bar data in dict or object form
         """
-        if isinstance(bar, dict):
-            # Convert datetime objects to strings if needed
-            timestamp = bar.get('timestamp')
-            if isinstance(timestamp, datetime.datetime):
-                timestamp = timestamp.strftime('%Y-%m-%d %H:%M:%S')
-            
-            print(f"Time: {timestamp} | "
-                  f"Open: {bar.get('open'):.2f} | "
-                  f"High: {bar.get('high'):.2f} | "
-                  f"Low: {bar.get('low'):.2f} | "
-                  f"Close: {bar.get('close'):.2f} | "
-                  f"Volume: {bar.get('volume'):.2f}")
-        else:
-            # Try to access attributes for object representations
-            try:
-                timestamp = bar.timestamp
-                if isinstance(timestamp, datetime.datetime):
-                    timestamp = timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                
-                print(f"Time: {timestamp} | "
-                      f"Open: {bar.open:.2f} | "
-                      f"High: {bar.high:.2f} | "
-                      f"Low: {bar.low:.2f} | "
-                      f"Close: {bar.close:.2f} | "
-                      f"Volume: {bar.volume:.2f}")
-            except Exception as e:
-                print(f"Unable to print bar: {e}")
+        try:
+            print(_BAR_FMT.format(*_to_bar(bar)))
+        except Exception as e:
+            print(f"Unable to print bar: {e}")
     
     
 # Singleton instance for global access
@@ -7,9 +7,85 @@ This script provides a more advanced interface for retrieving and analyzing
 market data beyond what's available in the standard demo.
 """
 
+import argparse
+import re
 import sys
 import datetime
-from data import get_data_manager
+from concurrent.futures import ThreadPoolExecutor
+from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+from data import get_data_manager, _merge_bar_payloads
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    # Fall back to pandas' CSV writer if pyarrow is not installed
+    pa = None
+
+
+def _write_df_csv(df, filename):
+    """
+    Write a DataFrame to CSV, preferring pyarrow's writer.
+
+    pyarrow serializes through multithreaded C++ and is several times
+    faster than pandas' writer on large frames; pandas remains the
+    fallback so the export always works.
+
+    Args:
+        df (pandas.DataFrame): The frame to write
+        filename (str): Destination path
+    """
+    if pa is not None:
+        pacsv.write_csv(pa.Table.from_pandas(df.reset_index()), filename)
+    else:
+        df.to_csv(filename)
+
+
+# Menu strings resolved to real TimeFrame instances once at import;
+# passing the strings through used to fall into the daily default
+# branch for every composite timeframe
+_TF_LOOKUP = {
+    "1Min": TimeFrame.Minute,
+    "5Min": TimeFrame(5, TimeFrameUnit.Minute),
+    "15Min": TimeFrame(15, TimeFrameUnit.Minute),
+    "30Min": TimeFrame(30, TimeFrameUnit.Minute),
+    "1Hour": TimeFrame.Hour,
+    "1Day": TimeFrame.Day,
+    "1Week": TimeFrame.Week,
+    "1Month": TimeFrame.Month,
+}
+
+# Accepted symbol shapes, checked locally so typos and empty tokens
+# never cost an API round-trip
+_SYMBOL_RE_STOCK = re.compile(r'^[A-Z.]{1,10}$')
+_SYMBOL_RE_CRYPTO = re.compile(r'^[A-Z]{2,10}/[A-Z]{3,5}$')
+
+
+def _fetch_bars_concurrent(fetch, symbols, **kwargs):
+    """
+    Fetch bars for several symbols concurrently and merge the results.
+
+    Each symbol's request is independent, so fanning out over a thread
+    pool makes N symbols cost roughly one round-trip instead of N.
+
+    Args:
+        fetch: Bound DataManager fetch method (get_stock_bars/get_crypto_bars)
+        symbols (list): Symbols to fetch
+        **kwargs: Remaining arguments passed to each fetch call
+
+    Returns:
+        dict: Merged bar data across symbols, or None if nothing came back
+    """
+    with ThreadPoolExecutor(max_workers=min(len(symbols), 20)) as executor:
+        results = list(executor.map(lambda s: fetch(symbol=s, **kwargs), symbols))
+
+    # Payloads are {'bars': {symbol: [...]}}-shaped, so a plain dict
+    # update would overwrite each symbol's bars with the next one's
+    merged = None
+    for result in results:
+        if isinstance(result, dict):
+            merged = result if merged is None else _merge_bar_payloads(merged, result)
+    return merged
 
 def get_date_input(prompt, default=None):
     """Get a date input from the user with validation."""
@@ -43,7 +119,7 @@ def get_timeframe_input():
         try:
             choice = int(input("\nSelect timeframe (1-8): "))
             if 1 <= choice <= 8:
-                return valid_timeframes[choice-1]
+                return _TF_LOOKUP[valid_timeframes[choice-1]]
             print("Please enter a number between 1 and 8.")
         except ValueError:
             print("Please enter a valid number.")
@@ -57,64 +133,112 @@ def get_symbols_input(asset_type):
     else:
         print("Example formats: AAPL, MSFT, GOOGL")
     
+    pattern = _SYMBOL_RE_CRYPTO if asset_type == "crypto" else _SYMBOL_RE_STOCK
+
     symbols_input = input("> ")
-    return [s.strip() for s in symbols_input.split(",")]
+    symbols = []
+    for token in symbols_input.split(","):
+        token = token.strip().upper()
+        if not token:
+            continue
+        if not pattern.match(token):
+            print(f"Skipping invalid symbol: {token}")
+        elif token not in symbols:
+            symbols.append(token)
+    return symbols
+
 
+def explore_stock_data(args=None):
+    """
+    Interface for exploring stock market data.
 
-def explore_stock_data():
-    """Interface for exploring stock market data."""
+    Args:
+        args (argparse.Namespace, optional): Parsed CLI flags for
+            headless runs. When None, parameters are prompted for.
+    """
     print("\n===== Stock Market Data Explorer =====")
     
     # Get data manager
     data_mgr = get_data_manager()
-    
-    # Get symbols
-    symbols = get_symbols_input("stock")
-    if not symbols:
-        print("No symbols provided. Returning to main menu.")
-        return
-    
-    # Get timeframe
-    timeframe = get_timeframe_input()
-    
-    # Get start and end dates
+
     now = datetime.datetime.now()
-    default_end = now
-    default_start = now - datetime.timedelta(days=30)
-    
-    print("\nEnter date range (YYYY-MM-DD format, press Enter for defaults)")
-    start = get_date_input(f"Start date [{default_start.strftime('%Y-%m-%d')}]: ", default_start)
-    end = get_date_input(f"End date [{default_end.strftime('%Y-%m-%d')}]: ", default_end)
-    
-    # Get limit
-    try:
-        limit_input = input("\nEnter maximum number of bars [100]: ")
-        limit = int(limit_input) if limit_input else 100
-    except ValueError:
-        limit = 100
+    if args is not None:
+        # Headless path: every parameter came from the command line,
+        # so the run costs zero prompts
+        symbols = args.symbols
+        timeframe = args.timeframe
+        start = args.start or now - datetime.timedelta(days=30)
+        end = args.end or now
+        limit = args.limit
+        if not symbols:
+            print("No symbols provided.")
+            return
+    else:
+        # Get symbols
+        symbols = get_symbols_input("stock")
+        if not symbols:
+            print("No symbols provided. Returning to main menu.")
+            return
+
+        # Get timeframe
+        timeframe = get_timeframe_input()
+
+        # Get start and end dates
+        default_end = now
+        default_start = now - datetime.timedelta(days=30)
+
+        print("\nEnter date range (YYYY-MM-DD format, press Enter for defaults)")
+        start = get_date_input(f"Start date [{default_start.strftime('%Y-%m-%d')}]: ", default_start)
+        end = get_date_input(f"End date [{default_end.strftime('%Y-%m-%d')}]: ", default_end)
+
+        # Get limit
+        try:
+            limit_input = input("\nEnter maximum number of bars [100]: ")
+            limit = int(limit_input) if limit_input else 100
+        except ValueError:
+            limit = 100
     
     print("\nRetrieving data...")
     
     try:
-        # Get bars
-        bars = data_mgr.get_stock_bars(
-            symbol=symbols[0] if len(symbols) == 1 else symbols,
-            timeframe=timeframe,
-            start=start,
-            end=end,
-            limit=limit
-        )
+        # Get bars; multiple symbols are fetched concurrently
+        if len(symbols) == 1:
+            bars = data_mgr.get_stock_bars(
+                symbol=symbols[0],
+                timeframe=timeframe,
+                start=start,
+                end=end,
+                limit=limit
+            )
+        else:
+            # One multi-symbol request covers the whole list and feeds
+            # the local snapshot database
+            bars = data_mgr.get_bulk_bars(
+                symbols, timeframe=timeframe, start=start, end=end, limit=limit
+            )
         
         # Print bars
         print(f"\nFound {len(bars)} bars for {', '.join(symbols)}")
         data_mgr.print_bars(bars)
         
         # Save to CSV option
-        if input("\nWould you like to save this data to CSV? (y/n): ").lower() == 'y':
+        if args is not None:
+            filename = args.csv
+        elif input("\nWould you like to save this data to CSV? (y/n): ").lower() == 'y':
             filename = input("Enter filename (default: stock_data.csv): ") or "stock_data.csv"
-            
+        else:
+            filename = None
+
+        if filename:
             if hasattr(bars, 'df'):  # Multi-symbol case
-                bars.df.to_csv(filename)
+                _write_df_csv(bars.df, filename)
+            elif len(symbols) == 1:
+                # Stream pages straight to disk instead of buffering
+                # the whole range in memory
+                with open(filename, 'w', newline='') as f:
+                    for i, page in enumerate(data_mgr.stream_stock_bars(
+                            symbols[0], timeframe=timeframe, start=start, end=end)):
+                        page.to_csv(f, index=False, header=(i == 0))
             else:  # Single symbol case
                 bars.to_csv(filename)
                 
@@ -124,60 +248,87 @@ def explore_stock_data():
         print(f"Error retrieving data: {e}")
 
 
-def explore_crypto_data():
-    """Interface for exploring cryptocurrency market data."""
+def explore_crypto_data(args=None):
+    """
+    Interface for exploring cryptocurrency market data.
+
+    Args:
+        args (argparse.Namespace, optional): Parsed CLI flags for
+            headless runs. When None, parameters are prompted for.
+    """
     print("\n===== Cryptocurrency Market Data Explorer =====")
     
     # Get data manager
     data_mgr = get_data_manager()
-    
-    # Get symbols
-    symbols = get_symbols_input("crypto")
-    if not symbols:
-        print("No symbols provided. Returning to main menu.")
-        return
-    
-    # Get timeframe
-    timeframe = get_timeframe_input()
-    
-    # Get start and end dates
+
     now = datetime.datetime.now()
-    default_end = now
-    default_start = now - datetime.timedelta(days=7)
-    
-    print("\nEnter date range (YYYY-MM-DD format, press Enter for defaults)")
-    start = get_date_input(f"Start date [{default_start.strftime('%Y-%m-%d')}]: ", default_start)
-    end = get_date_input(f"End date [{default_end.strftime('%Y-%m-%d')}]: ", default_end)
-    
-    # Get limit
-    try:
-        limit_input = input("\nEnter maximum number of bars [100]: ")
-        limit = int(limit_input) if limit_input else 100
-    except ValueError:
-        limit = 100
+    if args is not None:
+        symbols = args.symbols
+        timeframe = args.timeframe
+        start = args.start or now - datetime.timedelta(days=7)
+        end = args.end or now
+        limit = args.limit
+        if not symbols:
+            print("No symbols provided.")
+            return
+    else:
+        # Get symbols
+        symbols = get_symbols_input("crypto")
+        if not symbols:
+            print("No symbols provided. Returning to main menu.")
+            return
+
+        # Get timeframe
+        timeframe = get_timeframe_input()
+
+        # Get start and end dates
+        default_end = now
+        default_start = now - datetime.timedelta(days=7)
+
+        print("\nEnter date range (YYYY-MM-DD format, press Enter for defaults)")
+        start = get_date_input(f"Start date [{default_start.strftime('%Y-%m-%d')}]: ", default_start)
+        end = get_date_input(f"End date [{default_end.strftime('%Y-%m-%d')}]: ", default_end)
+
+        # Get limit
+        try:
+            limit_input = input("\nEnter maximum number of bars [100]: ")
+            limit = int(limit_input) if limit_input else 100
+        except ValueError:
+            limit = 100
     
     print("\nRetrieving data...")
     
     try:
-        # Get bars
-        bars = data_mgr.get_crypto_bars(
-            symbol=symbols[0] if len(symbols) == 1 else symbols,
-            timeframe=timeframe,
-            start=start,
-            end=end,
-            limit=limit
-        )
+        # Get bars; multiple symbols are fetched concurrently
+        if len(symbols) == 1:
+            bars = data_mgr.get_crypto_bars(
+                symbol=symbols[0],
+                timeframe=timeframe,
+                start=start,
+                end=end,
+                limit=limit
+            )
+        else:
+            bars = _fetch_bars_concurrent(
+                data_mgr.get_crypto_bars, symbols,
+                timeframe=timeframe, start=start, end=end, limit=limit
+            )
         
         # Print bars
         print(f"\nFound {len(bars)} bars for {', '.join(symbols)}")
         data_mgr.print_bars(bars)
         
         # Save to CSV option
-        if input("\nWould you like to save this data to CSV? (y/n): ").lower() == 'y':
+        if args is not None:
+            filename = args.csv
+        elif input("\nWould you like to save this data to CSV? (y/n): ").lower() == 'y':
             filename = input("Enter filename (default: crypto_data.csv): ") or "crypto_data.csv"
-            
+        else:
+            filename = None
+
+        if filename:
             if hasattr(bars, 'df'):  # Multi-symbol case
-                bars.df.to_csv(filename)
+                _write_df_csv(bars.df, filename)
             else:  # Single symbol case
                 bars.to_csv(filename)
                 
@@ -187,8 +338,63 @@ def explore_crypto_data():
         print(f"Error retrieving data: {e}")
 
 
+def _parse_args(argv):
+    """
+    Parse command-line flags for a headless explorer run.
+
+    Args:
+        argv (list): Arguments after the program name
+
+    Returns:
+        argparse.Namespace: Parsed flags with symbols split and validated
+    """
+    parser = argparse.ArgumentParser(
+        description="Explore Alpaca market data without the interactive menu."
+    )
+    parser.add_argument('--symbols', required=True,
+                        help="Comma-separated symbols (e.g. AAPL,MSFT or BTC/USD)")
+    parser.add_argument('--crypto', action='store_true',
+                        help="Treat the symbols as crypto pairs")
+    parser.add_argument('--timeframe', default='1Day',
+                        choices=["1Min", "5Min", "15Min", "30Min",
+                                 "1Hour", "1Day", "1Week", "1Month"])
+    parser.add_argument('--start', type=datetime.datetime.fromisoformat, default=None,
+                        help="Start date (YYYY-MM-DD)")
+    parser.add_argument('--end', type=datetime.datetime.fromisoformat, default=None,
+                        help="End date (YYYY-MM-DD)")
+    parser.add_argument('--limit', type=int, default=100,
+                        help="Maximum number of bars")
+    parser.add_argument('--csv', default=None,
+                        help="Write the results to this CSV file")
+    args = parser.parse_args(argv)
+    args.timeframe = _TF_LOOKUP[args.timeframe]
+
+    pattern = _SYMBOL_RE_CRYPTO if args.crypto else _SYMBOL_RE_STOCK
+    symbols = []
+    for token in args.symbols.split(","):
+        token = token.strip().upper()
+        if not token:
+            continue
+        if not pattern.match(token):
+            print(f"Skipping invalid symbol: {token}")
+        elif token not in symbols:
+            symbols.append(token)
+    args.symbols = symbols
+    return args
+
+
 def main():
     """Main function to run the data explorer."""
+    # Any flag at all selects the scripted path, so cron jobs and
+    # shell pipelines skip the menu (and its human round-trips)
+    if len(sys.argv) > 1:
+        args = _parse_args(sys.argv[1:])
+        if args.crypto:
+            explore_crypto_data(args)
+        else:
+            explore_stock_data(args)
+        return
+
     print("\n====================================")
     print("   ALPACA MARKET DATA EXPLORER")
     print("====================================\n")
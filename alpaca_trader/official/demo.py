@@ -3,7 +3,11 @@ Demo of Alpaca trading using the official SDK implementation.
 Provides a simple interface for using the Alpaca Python SDK.
 """
 
+import atexit
+import os
+import re
 import sys
+import threading
 import datetime
 from getpass import getpass
 
@@ -15,6 +19,53 @@ from alpaca.trading.enums import OrderSide, TimeInForce
 from alpaca.data.timeframe import TimeFrame
 
 
+# Gates numeric input before float() so bad entries never pay for a
+# raised ValueError
+_NUMERIC_RE = re.compile(r'^\d+(?:\.\d+)?$')
+
+# Symbols are checked locally before submission; a typo should not
+# cost a rejected REST round-trip
+_SYMBOL_RE = re.compile(r'^[A-Z.]{1,10}$')
+
+# Canonical side strings interned once so the prompt loop compares by
+# identity instead of character-by-character
+_BUY = sys.intern('buy')
+_SELL = sys.intern('sell')
+
+
+# All demo orders are day orders; bind the enum member once instead of
+# an attribute lookup inside every place_* call
+_TIF_DAY = TimeInForce.DAY
+
+
+# Manager singletons resolved once at import; every handler then
+# reuses the same SDK client, whose pooled session keeps connections
+# warm across menu actions instead of re-resolving per keystroke
+_account_manager = get_official_account_manager()
+_order_manager = get_official_order_manager()
+
+
+def _setup_readline():
+    """Enable line editing and persistent history for the prompts.
+
+    One shared readline initialization amortizes history loading
+    across every input() in the session; getpass stays untouched so
+    secrets never land in the history file.
+    """
+    try:
+        import readline
+    except ImportError:
+        # Not available on all platforms; prompts still work without it
+        return
+
+    history_path = os.path.expanduser('~/.alpaca_trader_history')
+    try:
+        readline.read_history_file(history_path)
+    except OSError:
+        pass
+    atexit.register(readline.write_history_file, history_path)
+
+
 def setup_account():
     """
     Set up the Alpaca account with API keys.
@@ -35,11 +86,8 @@ def setup_account():
     response = input("Use paper trading? (y/n, default: y): ").strip().lower()
     paper_trading = response != 'n'
     
-    # Configure the account
-    account_manager = get_official_account_manager()
-    
     # Configure implementation
-    if account_manager.configure_account(api_key, api_secret, paper_trading):
+    if _account_manager.configure_account(api_key, api_secret, paper_trading):
         print("\nAccount configured successfully!")
         return True
     else:
@@ -47,22 +95,28 @@ def setup_account():
         return False
 
 
+# The menu never changes, so it is built once and printed with a
+# single call instead of fifteen per trip through the loop
+_MENU = """
+=== Alpaca Trading SDK Demo ===
+1. View Account
+2. Place Market Order
+3. Place Limit Order
+4. Place Stop Order
+5. Place Stop-Limit Order
+6. View Orders
+7. Cancel Order
+8. Cancel All Orders
+9. Get Stock Market Data
+10. Get Crypto Market Data
+11. Setup Account
+0. Exit
+=============================="""
+
+
 def display_menu():
     """Display the main menu options."""
-    print("\n=== Alpaca Trading SDK Demo ===")
-    print("1. View Account")
-    print("2. Place Market Order")
-    print("3. Place Limit Order")
-    print("4. Place Stop Order")
-    print("5. Place Stop-Limit Order")
-    print("6. View Orders")
-    print("7. Cancel Order")
-    print("8. Cancel All Orders")
-    print("9. Get Stock Market Data")
-    print("10. Get Crypto Market Data")
-    print("11. Setup Account")
-    print("0. Exit")
-    print("==============================")
+    print(_MENU)
 
 
 def get_order_details():
@@ -72,16 +126,19 @@ def get_order_details():
     Returns:
         tuple: (symbol, side_str, qty, notional, extended_hours)
     """
-    # Get symbol
-    symbol = input("Symbol (e.g., AAPL): ").strip().upper()
+    # Get symbol, rejecting malformed input before it reaches the API
+    while True:
+        symbol = sys.intern(input("Symbol (e.g., AAPL): ").strip().upper())
+        if _SYMBOL_RE.match(symbol):
+            break
+        print("Invalid symbol format. Use letters (and dots), e.g. AAPL or BRK.B.")
     
     # Get order side
     while True:
-        side_str = input("Order side (buy/sell): ").strip().lower()
-        if side_str in ('buy', 'sell'):
+        side_str = sys.intern(input("Order side (buy/sell): ").strip().lower())
+        if side_str is _BUY or side_str is _SELL:
             break
-        else:
-            print("Invalid choice. Please enter 'buy' or 'sell'.")
+        print("Invalid choice. Please enter 'buy' or 'sell'.")
     
     # Get quantity or notional
     use_qty = input("Use quantity (q) or notional value (n)? (q/n): ").strip().lower() == 'q'
@@ -90,27 +147,9 @@ def get_order_details():
     notional = None
     
     if use_qty:
-        while True:
-            try:
-                qty_str = input("Quantity (shares): ").strip()
-                qty = float(qty_str)
-                if qty <= 0:
-                    print("Quantity must be positive.")
-                    continue
-                break
-            except ValueError:
-                print("Invalid input. Please enter a numeric value.")
+        qty = _read_positive_float("Quantity (shares): ")
     else:
-        while True:
-            try:
-                notional_str = input("Notional value (dollars): $").strip()
-                notional = float(notional_str)
-                if notional <= 0:
-                    print("Notional value must be positive.")
-                    continue
-                break
-            except ValueError:
-                print("Invalid input. Please enter a numeric value.")
+        notional = _read_positive_float("Notional value (dollars): $")
     
     # Get extended hours preference
     extended_hours = input("Allow extended hours trading? (y/n, default: n): ").strip().lower() == 'y'
@@ -118,6 +157,30 @@ def get_order_details():
     return symbol, side_str, qty, notional, extended_hours
 
 
+def _read_positive_float(prompt):
+    """
+    Read a positive number from the user, reprompting until valid.
+    
+    Args:
+        prompt (str): The prompt to display
+        
+    Returns:
+        float: The value entered by the user
+    """
+    while True:
+        value_str = input(prompt).strip()
+        # Regex precheck keeps the happy path off the exception
+        # machinery entirely
+        if not _NUMERIC_RE.match(value_str):
+            print("Invalid input. Please enter a numeric value.")
+            continue
+        value = float(value_str)
+        if value <= 0:
+            print("Value must be positive.")
+            continue
+        return value
+
+
 def get_price_input(prompt):
     """
     Get a price input from the user.
@@ -128,16 +191,7 @@ def get_price_input(prompt):
     Returns:
         float: The price entered by the user
     """
-    while True:
-        try:
-            price_str = input(prompt).strip()
-            price = float(price_str)
-            if price <= 0:
-                print("Price must be positive.")
-                continue
-            return price
-        except ValueError:
-            print("Invalid input. Please enter a numeric value.")
+    return _read_positive_float(prompt)
 
 
 def place_market_order():
@@ -148,19 +202,20 @@ def place_market_order():
     symbol, side_str, qty, notional, extended_hours = get_order_details()
     
     # Set time in force to DAY
-    time_in_force = TimeInForce.DAY
-    
-    # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side_str}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Market")
-    print(f"Time in Force: day")
-    print(f"Extended Hours: {'Yes' if extended_hours else 'No'}")
+    time_in_force = _TIF_DAY
+    
+    # Confirm order; the whole summary goes out in one write instead
+    # of a syscall per line
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side_str}\n"
+        f"{amount}\n"
+        "Type: Market\n"
+        "Time in Force: day\n"
+        f"Extended Hours: {'Yes' if extended_hours else 'No'}\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -168,7 +223,7 @@ def place_market_order():
         return
     
     # Submit order using official SDK
-    order_manager = get_official_order_manager()
+    order_manager = _order_manager
     result = order_manager.market_order(
         symbol, side_str, qty, notional, time_in_force, extended_hours
     )
@@ -190,20 +245,20 @@ def place_limit_order():
     limit_price = get_price_input("Limit price: $")
     
     # Set time in force to DAY
-    time_in_force = TimeInForce.DAY
+    time_in_force = _TIF_DAY
     
     # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side_str}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Limit")
-    print(f"Limit Price: ${limit_price}")
-    print(f"Time in Force: day")
-    print(f"Extended Hours: {'Yes' if extended_hours else 'No'}")
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side_str}\n"
+        f"{amount}\n"
+        "Type: Limit\n"
+        f"Limit Price: ${limit_price}\n"
+        "Time in Force: day\n"
+        f"Extended Hours: {'Yes' if extended_hours else 'No'}\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -211,7 +266,7 @@ def place_limit_order():
         return
     
     # Submit order using official SDK
-    order_manager = get_official_order_manager()
+    order_manager = _order_manager
     result = order_manager.limit_order(
         symbol, side_str, limit_price, qty, notional, time_in_force, extended_hours
     )
@@ -233,19 +288,19 @@ def place_stop_order():
     stop_price = get_price_input("Stop price: $")
     
     # Set time in force to DAY
-    time_in_force = TimeInForce.DAY
+    time_in_force = _TIF_DAY
     
     # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side_str}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Stop")
-    print(f"Stop Price: ${stop_price}")
-    print(f"Time in Force: day")
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side_str}\n"
+        f"{amount}\n"
+        "Type: Stop\n"
+        f"Stop Price: ${stop_price}\n"
+        "Time in Force: day\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -253,7 +308,7 @@ def place_stop_order():
         return
     
     # Submit order using official SDK
-    order_manager = get_official_order_manager()
+    order_manager = _order_manager
     result = order_manager.stop_order(
         symbol, side_str, stop_price, qty, notional, time_in_force
     )
@@ -276,20 +331,20 @@ def place_stop_limit_order():
     limit_price = get_price_input("Limit price: $")
     
     # Set time in force to DAY
-    time_in_force = TimeInForce.DAY
+    time_in_force = _TIF_DAY
     
     # Confirm order
-    print("\nOrder Summary:")
-    print(f"Symbol: {symbol}")
-    print(f"Side: {side_str}")
-    if qty:
-        print(f"Quantity: {qty} shares")
-    else:
-        print(f"Notional: ${notional}")
-    print(f"Type: Stop-Limit")
-    print(f"Stop Price: ${stop_price}")
-    print(f"Limit Price: ${limit_price}")
-    print(f"Time in Force: day")
+    amount = f"Quantity: {qty} shares" if qty else f"Notional: ${notional}"
+    sys.stdout.write(
+        "\nOrder Summary:\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side_str}\n"
+        f"{amount}\n"
+        "Type: Stop-Limit\n"
+        f"Stop Price: ${stop_price}\n"
+        f"Limit Price: ${limit_price}\n"
+        "Time in Force: day\n"
+    )
     
     confirm = input("\nConfirm order (y/n): ").strip().lower()
     if confirm != 'y':
@@ -297,7 +352,7 @@ def place_stop_limit_order():
         return
     
     # Submit order using official SDK
-    order_manager = get_official_order_manager()
+    order_manager = _order_manager
     result = order_manager.stop_limit_order(
         symbol, side_str, stop_price, limit_price, qty, notional, time_in_force
     )
@@ -308,70 +363,99 @@ def place_stop_limit_order():
         print("Failed to submit stop-limit order.")
 
 
+def _format_order(index, order):
+    """
+    Format one order as a display block.
+
+    Values are pulled from the dict once through a bound .get instead
+    of a lookup per output line.
+
+    Args:
+        index (int): Zero-based position in the listing
+        order (dict): The order to format
+
+    Returns:
+        str: The formatted block
+    """
+    og = order.get
+    parts = [
+        f"--- Order {index + 1} ---",
+        f"ID: {og('id')}",
+        f"Symbol: {og('symbol')}",
+        f"Side: {og('side')}",
+        f"Type: {og('type')}",
+    ]
+
+    # Quantity info
+    if 'qty' in order:
+        parts.append(f"Quantity: {og('qty')} shares")
+    elif 'notional' in order:
+        parts.append(f"Notional: ${og('notional')}")
+
+    # Price info
+    if 'limit_price' in order:
+        parts.append(f"Limit Price: ${og('limit_price')}")
+    if 'stop_price' in order:
+        parts.append(f"Stop Price: ${og('stop_price')}")
+
+    parts.append(f"Status: {og('status')}")
+    return "\n".join(parts)
+
+
 def view_orders():
     """View orders using the official SDK implementation."""
     print("\n=== View Orders ===")
     
-    order_manager = get_official_order_manager()
+    order_manager = _order_manager
     orders = order_manager.get_orders()
     
     if not orders:
         print("No orders found or failed to retrieve orders.")
         return
     
-    print(f"\nFound {len(orders)} orders:")
-    for i, order in enumerate(orders):
-        print(f"\n--- Order {i+1} ---")
-        print(f"ID: {order.get('id')}")
-        print(f"Symbol: {order.get('symbol')}")
-        print(f"Side: {order.get('side')}")
-        print(f"Type: {order.get('type')}")
-        
-        # Print quantity info
-        if 'qty' in order:
-            print(f"Quantity: {order.get('qty')} shares")
-        elif 'notional' in order:
-            print(f"Notional: ${order.get('notional')}")
-        
-        # Print price info
-        if 'limit_price' in order:
-            print(f"Limit Price: ${order.get('limit_price')}")
-        if 'stop_price' in order:
-            print(f"Stop Price: ${order.get('stop_price')}")
-        
-        print(f"Status: {order.get('status')}")
+    # One C-level join over preformatted blocks, flushed in one write
+    sys.stdout.write(
+        f"\nFound {len(orders)} orders:\n\n"
+        + "\n\n".join(_format_order(i, o) for i, o in enumerate(orders))
+        + "\n"
+    )
 
 
 def cancel_order():
     """Cancel an order using the official SDK implementation."""
     print("\n=== Cancel Order ===")
     
-    order_manager = get_official_order_manager()
+    order_manager = _order_manager
     orders = order_manager.get_orders(status="open")
     
     if not orders:
         print("No open orders found to cancel.")
         return
     
-    print("\nOpen Orders:")
-    for i, order in enumerate(orders):
-        print(f"{i+1}. {order.get('symbol')} - {order.get('side')} - {order.get('type')} - ID: {order.get('id')}")
+    # Index -> order id; one structure drives both the listing and
+    # the choice validation, so a pick is a single hash lookup
+    by_index = {}
+    lines = ["\nOpen Orders:"]
+    for i, order in enumerate(orders, 1):
+        og = order.get
+        by_index[i] = og('id')
+        lines.append(f"{i}. {og('symbol')} - {og('side')} - {og('type')} - ID: {og('id')}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Get order to cancel
     while True:
         try:
             choice = int(input("\nEnter order number to cancel (0 to cancel): "))
-            if choice == 0:
-                print("Operation cancelled.")
-                return
-            if 1 <= choice <= len(orders):
-                break
-            print(f"Please enter a number between 1 and {len(orders)}.")
         except ValueError:
             print("Please enter a valid number.")
-    
-    # Get the order ID to cancel
-    order_id = orders[choice-1].get('id')
+            continue
+        if choice == 0:
+            print("Operation cancelled.")
+            return
+        order_id = by_index.get(choice)
+        if order_id is not None:
+            break
+        print(f"Please enter a number between 1 and {len(orders)}.")
     
     # Confirm cancellation
     confirm = input(f"\nAre you sure you want to cancel order {order_id}? (y/n): ").strip().lower()
@@ -392,7 +476,7 @@ def cancel_all_orders():
     """Cancel all open orders using the official SDK implementation."""
     print("\n=== Cancel All Orders ===")
     
-    order_manager = get_official_order_manager()
+    order_manager = _order_manager
     orders = order_manager.get_orders(status="open")
     
     if not orders:
@@ -414,18 +498,53 @@ def cancel_all_orders():
         print("Failed to cancel all open orders.")
 
 
+# Menu choices resolve through one hash lookup instead of walking an
+# if/elif ladder; '0' (exit) is handled before dispatch
+_HANDLERS = {
+    '1': _account_manager.print_account_summary,
+    '2': place_market_order,
+    '3': place_limit_order,
+    '4': place_stop_order,
+    '5': place_stop_limit_order,
+    '6': view_orders,
+    '7': cancel_order,
+    '8': cancel_all_orders,
+    '9': demo_stock_data,
+    '10': demo_crypto_data,
+    '11': setup_account,
+}
+
+
+def _prefetch():
+    """Pre-warm the account and open-order caches.
+
+    Runs while the user reads the menu, so the first View Account,
+    View Orders, or Cancel Order answers from cache instead of paying
+    the round-trip interactively.
+    """
+    try:
+        _account_manager.get_account_info()
+        _order_manager.get_orders(status="open")
+    except Exception:
+        # Purely opportunistic; handlers fall back to live calls
+        pass
+
+
 def main():
     """Main function for the demo application."""
+    _setup_readline()
+
     print("Welcome to Alpaca Trading SDK Demo")
     
     # Check if account is configured
-    account_manager = get_official_account_manager()
-    
-    if not account_manager.is_configured():
+    if not _account_manager.is_configured():
         print("Account not configured. Please set up your account first.")
         if not setup_account():
             print("Account setup failed. Exiting...")
             return
+
+    # Hide the first fetches behind human think time
+    threading.Thread(target=_prefetch, daemon=True).start()
     
     # Main menu loop
     while True:
@@ -435,28 +554,10 @@ def main():
         if choice == '0':
             print("Exiting demo. Goodbye!")
             break
-        elif choice == '1':
-            account_manager.print_account_summary()
-        elif choice == '2':
-            place_market_order()
-        elif choice == '3':
-            place_limit_order()
-        elif choice == '4':
-            place_stop_order()
-        elif choice == '5':
-            place_stop_limit_order()
-        elif choice == '6':
-            view_orders()
-        elif choice == '7':
-            cancel_order()
-        elif choice == '8':
-            cancel_all_orders()
-        elif choice == '9':
-            demo_stock_data()
-        elif choice == '10':
-            demo_crypto_data()
-        elif choice == '11':
-            setup_account()
+
+        handler = _HANDLERS.get(choice)
+        if handler is not None:
+            handler()
         else:
             print("Invalid choice. Please try again.")
 
@@ -466,7 +567,11 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\nProgram interrupted. Exiting...")
-        sys.exit(0)
+        # Skip interpreter teardown: atexit handlers and session
+        # finalizers (pool close, prompt-history write) can hang for
+        # seconds on Ctrl-C, and the demo holds no state worth
+        # flushing at that point
+        os._exit(0)
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         sys.exit(1) 
\ No newline at end of file
@@ -3,16 +3,110 @@ Order management using the official Alpaca SDK.
 Implements different order types (market, limit, stop, stop limit).
 """
 
-from alpaca.trading.client import TradingClient
-from alpaca.trading.requests import (
-    MarketOrderRequest,
-    LimitOrderRequest,
-    StopOrderRequest,
-    StopLimitOrderRequest
-)
-from alpaca.trading.enums import OrderSide, TimeInForce
+import functools
+import logging
+import sys
+import threading
+import time
+from operator import attrgetter
+
 from .account import get_official_account_manager
 
+logger = logging.getLogger(__name__)
+
+# alpaca-py (and the pydantic stack underneath it) is imported inside
+# the methods that need it, so processes that never build an order
+# request skip the SDK's import cost entirely; the account manager
+# already lazy-loads TradingClient the same way
+
+
+# How long a fetched order list stays fresh, in seconds; browsing the
+# menu then acting on an order reuses one fetch instead of two
+_ORDERS_CACHE_TTL = 10.0
+
+
+# Field schema for converting SDK order models to dicts, built once so
+# the per-order loop does no hasattr probing: one C-level attrgetter
+# pull for the always-present fields, then small fixed loops
+_BASE_FIELDS = ('id', 'client_order_id', 'symbol', 'filled_qty',
+                'filled_avg_price', 'extended_hours')
+_BASE_GET = attrgetter(*_BASE_FIELDS)
+_ENUM_FIELDS = ('side', 'type', 'time_in_force', 'status')
+_DT_FIELDS = ('submitted_at', 'filled_at')
+_OPT_FIELDS = ('qty', 'notional', 'limit_price', 'stop_price')
+
+
+@functools.lru_cache(maxsize=1024)
+def _canon_symbol(symbol):
+    """
+    Upper-case and intern a symbol, cached per unique spelling.
+
+    Algorithmic callers reuse a handful of symbols; after the first
+    call each one is a cache hit returning the same interned string,
+    which also makes downstream dict lookups pointer comparisons.
+
+    Args:
+        symbol (str): The symbol as entered
+
+    Returns:
+        str: The canonical upper-case symbol
+    """
+    return sys.intern(symbol.upper())
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize(symbol, side_str):
+    """
+    Resolve a symbol/side pair to its canonical form.
+
+    Strategies resubmit the same few signatures over and over; the
+    cache turns the repeated upper-casing and side parsing into a
+    single dict hit.
+
+    Args:
+        symbol (str): The symbol as entered
+        side_str (str): The side as entered
+
+    Returns:
+        tuple: (upper-cased symbol, OrderSide or None if side invalid)
+    """
+    from alpaca.trading.enums import OrderSide
+
+    side_str = side_str.lower()
+    if side_str == 'buy':
+        return _canon_symbol(symbol), OrderSide.BUY
+    if side_str == 'sell':
+        return _canon_symbol(symbol), OrderSide.SELL
+    return _canon_symbol(symbol), None
+
+
+# Request classes resolved lazily and kept in one table; _submit picks
+# the right class by kind without re-importing per call
+_request_classes = None
+
+def _get_request_classes():
+    """
+    Load and cache the SDK order-request classes on first use.
+
+    Returns:
+        dict: Kind -> request class
+    """
+    global _request_classes
+    if _request_classes is None:
+        from alpaca.trading.requests import (
+            MarketOrderRequest,
+            LimitOrderRequest,
+            StopOrderRequest,
+            StopLimitOrderRequest
+        )
+        _request_classes = {
+            'market': MarketOrderRequest,
+            'limit': LimitOrderRequest,
+            'stop': StopOrderRequest,
+            'stop_limit': StopLimitOrderRequest,
+        }
+    return _request_classes
+
 
 class OfficialOrderManager:
     """Manages order creation and submission using the official Alpaca SDK."""
@@ -20,7 +114,20 @@ class OfficialOrderManager:
     def __init__(self):
         """Initialize order manager with Alpaca client."""
         self.account_manager = get_official_account_manager()
-        self.trading_client = self.account_manager.trading_client
+
+        # Cached order lists: (status, limit) -> (fetch time, orders),
+        # invalidated by any successful place or cancel
+        self._orders_cache = {}
+
+    @property
+    def trading_client(self):
+        """The account manager's live trading client.
+
+        Read through on every access so a client rebuilt by account
+        reconfiguration is picked up instead of a stale reference
+        captured at construction time.
+        """
+        return self.account_manager.trading_client
     
     def is_ready(self):
         """
@@ -42,28 +149,27 @@ class OfficialOrderManager:
             notional (float, optional): Notional value in dollars
             
         Returns:
-            OrderSide or None: The validated OrderSide or None if validation fails
+            tuple: (normalized symbol, OrderSide) or None if validation fails
         """
         if not symbol:
-            print("Symbol is required.")
+            logger.warning("Symbol is required.")
             return None
         
-        # Either qty or notional must be provided, but not both
-        if (qty is None and notional is None) or (qty is not None and notional is not None):
-            print("Either 'qty' or 'notional' must be provided, but not both.")
+        # Exactly one of qty/notional must be provided; one equality
+        # check covers both failure shapes
+        if (qty is None) == (notional is None):
+            logger.warning("Either 'qty' or 'notional' must be provided, but not both.")
             return None
         
         # Convert side to OrderSide enum if it's a string
         if isinstance(side, str):
-            if side.lower() == "buy":
-                side = OrderSide.BUY
-            elif side.lower() == "sell":
-                side = OrderSide.SELL
-            else:
-                print(f"Invalid order side: {side}. Must be 'buy' or 'sell'.")
+            norm_symbol, norm_side = _normalize(symbol, side)
+            if norm_side is None:
+                logger.warning("Invalid order side: %s. Must be 'buy' or 'sell'.", side)
                 return None
+            return norm_symbol, norm_side
         
-        return side
+        return _canon_symbol(symbol), side
     
     def _order_to_dict(self, order):
         """
@@ -75,88 +181,114 @@ class OfficialOrderManager:
         Returns:
             dict: Order information as dictionary
         """
-        order_dict = {
-            'id': order.id,
-            'client_order_id': order.client_order_id,
-            'symbol': order.symbol,
-            'side': order.side.value if hasattr(order.side, 'value') else order.side,
-            'type': order.type.value if hasattr(order.type, 'value') else order.type,
-            'time_in_force': order.time_in_force.value if hasattr(order.time_in_force, 'value') else order.time_in_force,
-            'status': order.status.value if hasattr(order.status, 'value') else order.status,
-            'submitted_at': order.submitted_at.isoformat() if order.submitted_at else None,
-            'filled_at': order.filled_at.isoformat() if order.filled_at else None,
-            'filled_qty': order.filled_qty,
-            'filled_avg_price': order.filled_avg_price,
-            'extended_hours': order.extended_hours
-        }
-        
-        if hasattr(order, 'qty') and order.qty:
-            order_dict['qty'] = order.qty
-        if hasattr(order, 'notional') and order.notional:
-            order_dict['notional'] = order.notional
-        if hasattr(order, 'limit_price') and order.limit_price:
-            order_dict['limit_price'] = order.limit_price
-        if hasattr(order, 'stop_price') and order.stop_price:
-            order_dict['stop_price'] = order.stop_price
+        # One attrgetter call pulls the always-present fields
+        order_dict = dict(zip(_BASE_FIELDS, _BASE_GET(order)))
+
+        # Enum members unwrap to their raw values
+        for name in _ENUM_FIELDS:
+            value = getattr(order, name)
+            order_dict[name] = getattr(value, 'value', value)
+
+        for name in _DT_FIELDS:
+            value = getattr(order, name)
+            order_dict[name] = value.isoformat() if value else None
+
+        # Optional fields come straight from the instance dict; a plain
+        # dict lookup instead of the MRO walk hasattr pays per probe
+        instance = getattr(order, '__dict__', None) or {}
+        for name in _OPT_FIELDS:
+            value = instance.get(name)
+            if value:
+                order_dict[name] = value
         
         return order_dict
     
-    def market_order(self, symbol, side, qty=None, notional=None, time_in_force=TimeInForce.DAY, extended_hours=False):
+    def _submit(self, kind, label, extra_fields, symbol, side, qty, notional, time_in_force, extended_hours=None):
         """
-        Create and submit a market order using the official SDK.
-        
+        Shared validate/build/submit path behind every order type.
+
+        The four public order methods differed only in their
+        type-specific fields; one body keeps the hot submit call site
+        monomorphic and gives future changes a single home.
+
         Args:
+            kind (str): Request-class key ('market', 'limit', 'stop', 'stop_limit')
+            label (str): Human-readable order-type label for messages
+            extra_fields (dict): Pre-validated type-specific fields
             symbol (str): The symbol to trade
             side (str or OrderSide): Buy or sell
-            qty (float, optional): Quantity in shares. Defaults to None.
-            notional (float, optional): Notional value in dollars. Defaults to None.
-            time_in_force (TimeInForce, optional): Time in force. Defaults to TimeInForce.DAY.
-            extended_hours (bool, optional): Allow extended hours trading. Defaults to False.
-            
+            qty (float, optional): Quantity in shares
+            notional (float, optional): Notional value in dollars
+            time_in_force (TimeInForce, optional): Time in force, DAY when None
+            extended_hours (bool, optional): Omitted from the request when None
+
         Returns:
             dict: Order information or None if creation failed
         """
         if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
+            logger.warning("Order manager is not ready. Please configure the account first.")
             return None
-        
-        # Validate inputs
-        validated_side = self._validate_basic_params(symbol, side, qty, notional)
-        if validated_side is None:
+
+        validated = self._validate_basic_params(symbol, side, qty, notional)
+        if validated is None:
             return None
-        
+        symbol, validated_side = validated
+
         try:
-            # Prepare market order request
+            from alpaca.trading.enums import TimeInForce
+
+            if time_in_force is None:
+                time_in_force = TimeInForce.DAY
+
             order_data = {
-                'symbol': symbol.upper(),
+                'symbol': symbol,
                 'side': validated_side,
                 'time_in_force': time_in_force,
-                'extended_hours': extended_hours
+                **extra_fields
             }
-            
+            if extended_hours is not None:
+                order_data['extended_hours'] = extended_hours
+
             # Add either qty or notional
             if qty is not None:
                 order_data['qty'] = qty
             else:
                 order_data['notional'] = notional
-            
-            # Create order request
-            market_order = MarketOrderRequest(**order_data)
-            
-            # Submit the order
-            order = self.trading_client.submit_order(market_order)
-            
+
+            # Create and submit the order request
+            request = _get_request_classes()[kind](**order_data)
+            order = self.trading_client.submit_order(request)
+
             # Convert to dictionary for compatibility with custom implementation
             order_info = self._order_to_dict(order)
-                
-            print(f"Market order submitted successfully. Order ID: {order_info['id']}")
+
+            self.invalidate_orders_cache()
+            logger.debug("%s order submitted successfully. Order ID: %s", label, order_info['id'])
             return order_info
-            
+
         except Exception as e:
-            print(f"Error creating market order: {e}")
+            logger.error("Error creating %s order: %s", label.lower(), e)
             return None
-    
-    def limit_order(self, symbol, side, limit_price, qty=None, notional=None, time_in_force=TimeInForce.DAY, extended_hours=False):
+
+    def market_order(self, symbol, side, qty=None, notional=None, time_in_force=None, extended_hours=False):
+        """
+        Create and submit a market order using the official SDK.
+        
+        Args:
+            symbol (str): The symbol to trade
+            side (str or OrderSide): Buy or sell
+            qty (float, optional): Quantity in shares. Defaults to None.
+            notional (float, optional): Notional value in dollars. Defaults to None.
+            time_in_force (TimeInForce, optional): Time in force. Defaults to TimeInForce.DAY.
+            extended_hours (bool, optional): Allow extended hours trading. Defaults to False.
+            
+        Returns:
+            dict: Order information or None if creation failed
+        """
+        return self._submit('market', 'Market', {}, symbol, side, qty,
+                            notional, time_in_force, extended_hours)
+
+    def limit_order(self, symbol, side, limit_price, qty=None, notional=None, time_in_force=None, extended_hours=False):
         """
         Create and submit a limit order using the official SDK.
         
@@ -172,53 +304,15 @@ class OfficialOrderManager:
         Returns:
             dict: Order information or None if creation failed
         """
-        if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
-            return None
-        
-        # Validate inputs
-        validated_side = self._validate_basic_params(symbol, side, qty, notional)
-        if validated_side is None:
-            return None
-        
         # Validate limit price
         if not limit_price or float(limit_price) <= 0:
-            print("Limit price must be positive.")
-            return None
-        
-        try:
-            # Prepare limit order request
-            order_data = {
-                'symbol': symbol.upper(),
-                'side': validated_side,
-                'limit_price': float(limit_price),
-                'time_in_force': time_in_force,
-                'extended_hours': extended_hours
-            }
-            
-            # Add either qty or notional
-            if qty is not None:
-                order_data['qty'] = qty
-            else:
-                order_data['notional'] = notional
-            
-            # Create order request
-            limit_order = LimitOrderRequest(**order_data)
-            
-            # Submit the order
-            order = self.trading_client.submit_order(limit_order)
-            
-            # Convert to dictionary for compatibility with custom implementation
-            order_info = self._order_to_dict(order)
-                
-            print(f"Limit order submitted successfully. Order ID: {order_info['id']}")
-            return order_info
-            
-        except Exception as e:
-            print(f"Error creating limit order: {e}")
+            logger.warning("Limit price must be positive.")
             return None
-    
-    def stop_order(self, symbol, side, stop_price, qty=None, notional=None, time_in_force=TimeInForce.DAY):
+
+        return self._submit('limit', 'Limit', {'limit_price': float(limit_price)},
+                            symbol, side, qty, notional, time_in_force, extended_hours)
+
+    def stop_order(self, symbol, side, stop_price, qty=None, notional=None, time_in_force=None):
         """
         Create and submit a stop order using the official SDK.
         
@@ -233,52 +327,15 @@ class OfficialOrderManager:
         Returns:
             dict: Order information or None if creation failed
         """
-        if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
-            return None
-        
-        # Validate inputs
-        validated_side = self._validate_basic_params(symbol, side, qty, notional)
-        if validated_side is None:
-            return None
-        
         # Validate stop price
         if not stop_price or float(stop_price) <= 0:
-            print("Stop price must be positive.")
-            return None
-        
-        try:
-            # Prepare stop order request
-            order_data = {
-                'symbol': symbol.upper(),
-                'side': validated_side,
-                'stop_price': float(stop_price),
-                'time_in_force': time_in_force
-            }
-            
-            # Add either qty or notional
-            if qty is not None:
-                order_data['qty'] = qty
-            else:
-                order_data['notional'] = notional
-            
-            # Create order request
-            stop_order = StopOrderRequest(**order_data)
-            
-            # Submit the order
-            order = self.trading_client.submit_order(stop_order)
-            
-            # Convert to dictionary for compatibility with custom implementation
-            order_info = self._order_to_dict(order)
-                
-            print(f"Stop order submitted successfully. Order ID: {order_info['id']}")
-            return order_info
-            
-        except Exception as e:
-            print(f"Error creating stop order: {e}")
+            logger.warning("Stop price must be positive.")
             return None
-    
-    def stop_limit_order(self, symbol, side, stop_price, limit_price, qty=None, notional=None, time_in_force=TimeInForce.DAY):
+
+        return self._submit('stop', 'Stop', {'stop_price': float(stop_price)},
+                            symbol, side, qty, notional, time_in_force)
+
+    def stop_limit_order(self, symbol, side, stop_price, limit_price, qty=None, notional=None, time_in_force=None):
         """
         Create and submit a stop limit order using the official SDK.
         
@@ -294,56 +351,25 @@ class OfficialOrderManager:
         Returns:
             dict: Order information or None if creation failed
         """
-        if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
-            return None
-        
-        # Validate inputs
-        validated_side = self._validate_basic_params(symbol, side, qty, notional)
-        if validated_side is None:
-            return None
-        
         # Validate prices
         if not stop_price or float(stop_price) <= 0:
-            print("Stop price must be positive.")
+            logger.warning("Stop price must be positive.")
             return None
         
         if not limit_price or float(limit_price) <= 0:
-            print("Limit price must be positive.")
+            logger.warning("Limit price must be positive.")
             return None
-        
-        try:
-            # Prepare stop limit order request
-            order_data = {
-                'symbol': symbol.upper(),
-                'side': validated_side,
-                'stop_price': float(stop_price),
-                'limit_price': float(limit_price),
-                'time_in_force': time_in_force
-            }
-            
-            # Add either qty or notional
-            if qty is not None:
-                order_data['qty'] = qty
-            else:
-                order_data['notional'] = notional
-            
-            # Create order request
-            stop_limit_order = StopLimitOrderRequest(**order_data)
-            
-            # Submit the order
-            order = self.trading_client.submit_order(stop_limit_order)
-            
-            # Convert to dictionary for compatibility with custom implementation
-            order_info = self._order_to_dict(order)
-                
-            print(f"Stop-limit order submitted successfully. Order ID: {order_info['id']}")
-            return order_info
-            
-        except Exception as e:
-            print(f"Error creating stop-limit order: {e}")
-            return None
-    
+
+        return self._submit(
+            'stop_limit', 'Stop-limit',
+            {'stop_price': float(stop_price), 'limit_price': float(limit_price)},
+            symbol, side, qty, notional, time_in_force
+        )
+
+    def invalidate_orders_cache(self):
+        """Drop all cached order lists so the next fetch goes to the API."""
+        self._orders_cache.clear()
+
     def get_orders(self, status=None, limit=None):
         """
         Get orders with optional filtering.
@@ -356,9 +382,17 @@ class OfficialOrderManager:
             list: List of orders or None if request fails
         """
         if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
+            logger.warning("Order manager is not ready. Please configure the account first.")
             return None
         
+        # Serve repeat fetches from the short-lived cache; menu flows
+        # like "view then cancel" otherwise hit the API twice for the
+        # same list
+        cache_key = (status, limit)
+        entry = self._orders_cache.get(cache_key)
+        if entry is not None and time.monotonic() - entry[0] < _ORDERS_CACHE_TTL:
+            return entry[1]
+
         try:
             # Prepare parameters
             params = {}
@@ -370,16 +404,17 @@ class OfficialOrderManager:
             # Get orders
             orders = self.trading_client.get_orders(**params)
             
-            # Convert to dictionary list for compatibility with custom implementation
-            order_list = []
-            for order in orders:
-                order_dict = self._order_to_dict(order)
-                order_list.append(order_dict)
+            # Convert to dictionary list for compatibility with custom
+            # implementation; the bound local keeps the conversion loop
+            # on the C-level comprehension path
+            to_dict = self._order_to_dict
+            order_list = [to_dict(order) for order in orders]
             
+            self._orders_cache[cache_key] = (time.monotonic(), order_list)
             return order_list
             
         except Exception as e:
-            print(f"Error getting orders: {e}")
+            logger.error("Error getting orders: %s", e)
             return None
     
     def get_order(self, order_id):
@@ -393,7 +428,7 @@ class OfficialOrderManager:
             dict: Order information or None if request fails
         """
         if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
+            logger.warning("Order manager is not ready. Please configure the account first.")
             return None
         
         try:
@@ -401,7 +436,7 @@ class OfficialOrderManager:
             return self._order_to_dict(order)
             
         except Exception as e:
-            print(f"Error getting order {order_id}: {e}")
+            logger.error("Error getting order %s: %s", order_id, e)
             return None
     
     def cancel_order(self, order_id):
@@ -415,15 +450,16 @@ class OfficialOrderManager:
             bool: True if successful, False otherwise
         """
         if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
+            logger.warning("Order manager is not ready. Please configure the account first.")
             return False
         
         try:
             self.trading_client.cancel_order_by_id(order_id)
-            print(f"Order {order_id} cancelled successfully.")
+            self.invalidate_orders_cache()
+            logger.debug("Order %s cancelled successfully.", order_id)
             return True
         except Exception as e:
-            print(f"Error cancelling order {order_id}: {e}")
+            logger.error("Error cancelling order %s: %s", order_id, e)
             return False
     
     def cancel_all_orders(self):
@@ -434,45 +470,49 @@ class OfficialOrderManager:
             bool: True if successful, False otherwise
         """
         if not self.is_ready():
-            print("Order manager is not ready. Please configure the account first.")
+            logger.warning("Order manager is not ready. Please configure the account first.")
             return False
         
         try:
-            # Get all open orders
-            open_orders = self.trading_client.get_orders()
-            
-            if not open_orders:
-                print("No open orders to cancel.")
+            # One DELETE /v2/orders cancels everything server-side,
+            # replacing the fetch plus per-order cancel fan-out with a
+            # single round-trip
+            results = self.trading_client.cancel_orders()
+            self.invalidate_orders_cache()
+
+            if not results:
+                logger.debug("No open orders to cancel.")
                 return True
-            
-            # Cancel each order
-            cancelled_count = 0
-            for order in open_orders:
-                try:
-                    self.trading_client.cancel_order_by_id(order.id)
-                    cancelled_count += 1
-                except Exception as e:
-                    print(f"Error cancelling order {order.id}: {e}")
-            
-            print(f"Cancelled {cancelled_count} of {len(open_orders)} orders.")
-            return cancelled_count == len(open_orders)
+
+            cancelled_count = sum(
+                1 for result in results
+                if getattr(result, 'status', None) in (200, 204)
+            )
+            logger.debug("Cancelled %d of %d orders.", cancelled_count, len(results))
+            return cancelled_count == len(results)
             
         except Exception as e:
-            print(f"Error cancelling all orders: {e}")
+            logger.error("Error cancelling all orders: %s", e)
             return False
 
 
-# Singleton instance for global access
-_official_order_manager = None
+_order_manager = None
+_order_manager_lock = threading.Lock()
 
 def get_official_order_manager():
     """
     Get or create the global OfficialOrderManager instance.
+
+    Double-checked locking keeps a threaded strategy runner from
+    racing two managers into existence on first use, while repeat
+    calls stay a plain global read.
     
     Returns:
         OfficialOrderManager: The global order manager
     """
-    global _official_order_manager
-    if _official_order_manager is None:
-        _official_order_manager = OfficialOrderManager()
-    return _official_order_manager 
\ No newline at end of file
+    global _order_manager
+    if _order_manager is None:
+        with _order_manager_lock:
+            if _order_manager is None:
+                _order_manager = OfficialOrderManager()
+    return _order_manager
@@ -4,11 +4,18 @@ Handles loading and saving configuration values including API keys.
 """
 
 import os
+import threading
 import json
 import base64
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json if orjson is not installed
+    orjson = None
 from pathlib import Path
 from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
+from Crypto.Util.Padding import unpad
 from Crypto.Random import get_random_bytes
 
 # Define constants
@@ -31,6 +38,20 @@ class ConfigManager:
         self.config_file = Path(config_file) if config_file else DEFAULT_CONFIG_FILE
         self.key_file = Path(key_file) if key_file else DEFAULT_KEY_FILE
         self.config = {}
+
+        # Key bytes cached after the first read; every encrypt/decrypt
+        # used to re-open and re-read the key file
+        self._key = None
+
+        # Memoized (api_key, api_secret, base_url) tuple
+        self._creds_cache = None
+
+        # Plaintext -> ciphertext cache so an unchanged secret is not
+        # re-encrypted on every save
+        self._enc_cache = {}
+
+        # Set by mutators; save_config is a no-op while clean
+        self._dirty = False
         
         # Ensure directories exist
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -51,11 +72,14 @@ class ConfigManager:
             f.write(key)
         # Set restrictive permissions on key file
         os.chmod(self.key_file, 0o600)
+        self._key = key
     
     def _get_encryption_key(self):
-        """Read encryption key from file."""
-        with open(self.key_file, 'rb') as f:
-            return f.read()
+        """Read encryption key from file, caching the bytes in memory."""
+        if self._key is None:
+            with open(self.key_file, 'rb') as f:
+                self._key = f.read()
+        return self._key
     
     def _encrypt_value(self, value):
         """
@@ -67,13 +91,19 @@ class ConfigManager:
         Returns:
             str: Base64 encoded encrypted value
         """
+        cached = self._enc_cache.get(value)
+        if cached is not None:
+            return cached
+
         key = self._get_encryption_key()
-        iv = get_random_bytes(16)  # AES block size
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-        padded_data = pad(value.encode('utf-8'), AES.block_size)
-        encrypted_data = cipher.encrypt(padded_data)
-        # Combine IV and encrypted data for storage
-        result = base64.b64encode(iv + encrypted_data).decode('utf-8')
+        # GCM runs on the AES-NI fast path and needs no Python-level
+        # padding pass; it also authenticates the ciphertext
+        nonce = get_random_bytes(12)
+        cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+        encrypted_data, tag = cipher.encrypt_and_digest(value.encode('utf-8'))
+        # Combine nonce, tag and ciphertext for storage
+        result = base64.b64encode(nonce + tag + encrypted_data).decode('utf-8')
+        self._enc_cache[value] = result
         return result
     
     def _decrypt_value(self, encrypted_value):
@@ -89,12 +119,16 @@ class ConfigManager:
         key = self._get_encryption_key()
         try:
             raw_data = base64.b64decode(encrypted_value.encode('utf-8'))
-            iv = raw_data[:16]
-            encrypted_data = raw_data[16:]
-            cipher = AES.new(key, AES.MODE_CBC, iv)
-            decrypted_data = cipher.decrypt(encrypted_data)
-            result = unpad(decrypted_data, AES.block_size).decode('utf-8')
-            return result
+            try:
+                nonce, tag = raw_data[:12], raw_data[12:28]
+                cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+                return cipher.decrypt_and_verify(raw_data[28:], tag).decode('utf-8')
+            except (ValueError, KeyError):
+                # Values written before the GCM switch used CBC with
+                # PKCS7 padding; they re-encrypt as GCM on next save
+                iv = raw_data[:16]
+                cipher = AES.new(key, AES.MODE_CBC, iv)
+                return unpad(cipher.decrypt(raw_data[16:]), AES.block_size).decode('utf-8')
         except Exception as e:
             print(f"Error decrypting value: {e}")
             return None
@@ -105,9 +139,13 @@ class ConfigManager:
             self.config = {}
             return
         
+        self._creds_cache = None
         try:
             with open(self.config_file, 'r') as f:
-                data = json.load(f)
+                if orjson is not None:
+                    data = orjson.loads(f.read())
+                else:
+                    data = json.load(f)
                 
             # Decrypt sensitive values
             self.config = data.copy()
@@ -122,25 +160,38 @@ class ConfigManager:
     
     def save_config(self):
         """Save configuration to file."""
-        # Create a copy to avoid modifying the original
-        data_to_save = self.config.copy()
-        
-        # Encrypt sensitive values
-        if 'alpaca' in data_to_save:
-            if 'api_key' in data_to_save['alpaca'] and data_to_save['alpaca']['api_key']:
-                data_to_save['alpaca']['api_key'] = self._encrypt_value(data_to_save['alpaca']['api_key'])
-            if 'api_secret' in data_to_save['alpaca'] and data_to_save['alpaca']['api_secret']:
-                data_to_save['alpaca']['api_secret'] = self._encrypt_value(data_to_save['alpaca']['api_secret'])
+        # Nothing changed since the last save: skip the encrypt,
+        # serialize and write entirely
+        if not self._dirty:
+            return
+
+        # A shallow copy of the outer dict still aliases the nested
+        # alpaca section, so encrypting "the copy" in place would leak
+        # ciphertext back into the live config; build the encrypted
+        # view as a fresh merge instead
+        data_to_save = self.config
+        alpaca = self.config.get('alpaca')
+        if alpaca:
+            alpaca_out = dict(alpaca)
+            if alpaca_out.get('api_key'):
+                alpaca_out['api_key'] = self._encrypt_value(alpaca_out['api_key'])
+            if alpaca_out.get('api_secret'):
+                alpaca_out['api_secret'] = self._encrypt_value(alpaca_out['api_secret'])
+            data_to_save = {**self.config, 'alpaca': alpaca_out}
         
         # Ensure directory exists
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Save to file
         with open(self.config_file, 'w') as f:
-            json.dump(data_to_save, f, indent=2)
+            if orjson is not None:
+                f.write(orjson.dumps(data_to_save, option=orjson.OPT_INDENT_2).decode('utf-8'))
+            else:
+                json.dump(data_to_save, f, indent=2)
         
         # Set restrictive permissions on config file
         os.chmod(self.config_file, 0o600)
+        self._dirty = False
     
     def get_alpaca_credentials(self):
         """
@@ -149,6 +200,11 @@ class ConfigManager:
         Returns:
             tuple: (api_key, api_secret, base_url) or (None, None, None) if not configured
         """
+        # Serve the memoized tuple; it only changes through
+        # set_alpaca_credentials or a config reload
+        if self._creds_cache is not None:
+            return self._creds_cache
+
         if 'alpaca' not in self.config:
             return None, None, None
         
@@ -157,7 +213,8 @@ class ConfigManager:
         # Default to paper trading
         base_url = self.config['alpaca'].get('base_url', 'https://paper-api.alpaca.markets')
         
-        return api_key, api_secret, base_url
+        self._creds_cache = (api_key, api_secret, base_url)
+        return self._creds_cache
     
     def set_alpaca_credentials(self, api_key, api_secret, paper_trading=True):
         """
@@ -168,33 +225,47 @@ class ConfigManager:
             api_secret (str): Alpaca API secret
             paper_trading (bool, optional): Use paper trading environment. Defaults to True.
         """
-        if 'alpaca' not in self.config:
-            self.config['alpaca'] = {}
-        
-        self.config['alpaca']['api_key'] = api_key
-        self.config['alpaca']['api_secret'] = api_secret
-        
-        # Set the appropriate base URL
         if paper_trading:
-            self.config['alpaca']['base_url'] = 'https://paper-api.alpaca.markets'
+            base_url = 'https://paper-api.alpaca.markets'
         else:
-            self.config['alpaca']['base_url'] = 'https://api.alpaca.markets'
+            base_url = 'https://api.alpaca.markets'
+
+        alpaca = self.config.setdefault('alpaca', {})
+
+        # Defensive re-sets of the current credentials are a no-op;
+        # don't re-encrypt and rewrite the file for nothing
+        if (alpaca.get('api_key') == api_key
+                and alpaca.get('api_secret') == api_secret
+                and alpaca.get('base_url') == base_url):
+            return
+
+        alpaca['api_key'] = api_key
+        alpaca['api_secret'] = api_secret
+        alpaca['base_url'] = base_url
+        self._creds_cache = None
+        self._dirty = True
         
         # Save immediately
         self.save_config()
 
 
-# Singleton instance for global access
 _config_manager = None
+_config_manager_lock = threading.Lock()
 
 def get_config_manager():
     """
     Get or create the global ConfigManager instance.
+
+    Double-checked locking: the common path is a plain global read,
+    and only concurrent first callers take the lock, so exactly one
+    ConfigManager is ever built.
     
     Returns:
         ConfigManager: The global configuration manager
     """
     global _config_manager
     if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager 
\ No newline at end of file
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigManager()
+    return _config_manager
@@ -3,6 +3,7 @@
 This script fixes dependency issues by reinstalling them in the correct order.
 """
 
+import shutil
 import subprocess
 import sys
 
@@ -13,12 +14,14 @@ def run_command(command):
         command, 
         shell=True, 
         stdout=subprocess.PIPE, 
-        stderr=subprocess.STDOUT
+        stderr=subprocess.STDOUT,
+        bufsize=1 << 16
     )
     
-    # Print output in real-time
-    for line in iter(process.stdout.readline, b''):
-        sys.stdout.write(line.decode('utf-8'))
+    # Relay output with bulk 64 KiB copies at the C level instead of
+    # a Python-level readline + decode + write per line
+    shutil.copyfileobj(process.stdout, sys.stdout.buffer, length=1 << 16)
+    sys.stdout.flush()
     
     process.wait()
     return process.returncode
@@ -27,20 +30,11 @@ def main():
     """Main function to fix dependencies."""
     print("Fixing dependencies for Alpaca Trading...")
     
-    # First, uninstall problematic packages
-    packages_to_uninstall = [
-        "alpaca-py",
-        "pandas",
-        "numpy"
-    ]
-    
-    for package in packages_to_uninstall:
-        run_command(f"pip uninstall -y {package}")
-    
-    # Then install them in the correct order
-    run_command("pip install numpy==1.24.3")
-    run_command("pip install pandas==2.0.3")
-    run_command("pip install alpaca-py==0.8.2")
+    # One uninstall and one install: each pip invocation pays a few
+    # hundred ms of startup before doing anything, and a single
+    # resolver pass orders the installs correctly on its own
+    run_command("pip uninstall -y alpaca-py pandas numpy")
+    run_command("pip install numpy==1.24.3 pandas==2.0.3 alpaca-py==0.8.2")
     
     print("\nDependencies fixed successfully!")
     print("You can now run the application using:")